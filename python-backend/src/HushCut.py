@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 
 from __future__ import annotations
-from collections import Counter, defaultdict
+from collections import defaultdict
 import json
+import hmac
 import http.client
 from http.client import HTTPConnection
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
-import signal
 import socket
 import threading
 from time import time, sleep
@@ -15,27 +15,46 @@ import traceback
 from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Sequence
 
 import logging
+import logging.handlers
+import queue
 import re
 import os
 import sys
 import subprocess
+import shutil
+import signal
+import stat
 import argparse
-from concurrent.futures import ThreadPoolExecutor
+import functools
+from bisect import bisect_left, bisect_right
 import atexit
 import urllib.parse
 import uuid
-import copy
+import weakref
+import random
+from itertools import chain
+from operator import itemgetter
 from subprocess import CompletedProcess
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Resolve's bundled interpreter does not ship orjson
+    orjson = None
 
 
 # GLOBALS
+IS_LINUX = sys.platform.startswith("linux")
+IS_MAC = sys.platform.startswith("darwin")
+IS_WIN = sys.platform.startswith("win")
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 TEMP_DIR: str = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "tmp")
 
-if sys.platform.startswith("win"):
+if IS_WIN:
     TEMP_DIR = os.path.join(str(os.environ.get("LOCALAPPDATA")), "tmp")
 
-elif sys.platform.startswith("darwin"):
+elif IS_MAC:
     TEMP_DIR = os.path.join(
         os.path.expanduser("~/Library/Application Support"), "HushCut", "tmp"
     )
@@ -54,23 +73,52 @@ GO_SERVER_PORT = 0
 PYTHON_LISTEN_PORT = 0
 SERVER_INSTANCE_HOLDER = []
 SHUTDOWN_EVENT = threading.Event()
+# Requests are served concurrently; commands that drive Resolve and mutate
+# PROJECT_DATA/TIMELINE are serialized through this lock.
+COMMAND_LOCK = threading.Lock()
 
 STANDALONE_MODE = False
 RESOLVE = None
 FFMPEG = "ffmpeg"
 MAKE_NEW_TIMELINE = True
+# Whether the last get_project_data call exported the timeline to OTIO.
+TIMELINE_OTIO_EXPORTED = False
 MAX_RETRIES = 100
 created_timelines = {}
+# Set HUSHCUT_QUIET_CHILD=1 to discard the Go app's console output instead of
+# letting it inherit ours.
+CHILD_OUTPUT = subprocess.DEVNULL if os.environ.get("HUSHCUT_QUIET_CHILD") else None
+# Environment for launching the Go app, prepared once.
+CHILD_ENV = os.environ.copy()
+if IS_LINUX:
+    CHILD_ENV["GDK_BACKEND"] = "x11"
 
 
+@functools.lru_cache(maxsize=4096)
 def uuid_from_path(path: str) -> uuid.UUID:
     return uuid.uuid5(uuid.NAMESPACE_URL, path)
 
 
+@functools.lru_cache(maxsize=4096)
+def _norm_path(path: str) -> str:
+    # Interned: the same few source paths back every clip in a project.
+    return sys.intern(os.path.normpath(path))
+
+
 def uuid4() -> uuid.UUID:
     return uuid.uuid4()
 
 
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Exponential backoff for the given 0-based retry attempt. The jitter stays
+    inside the cap: the result lies between half the capped delay and the
+    capped delay itself, so it never exceeds `cap`.
+    """
+    delay = min(cap, base * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
 def sec_to_frames(seconds: float, fps: float) -> float:
     """Converts time in seconds to frame number using ceiling."""
     if fps <= 0:
@@ -78,50 +126,71 @@ def sec_to_frames(seconds: float, fps: float) -> float:
     return seconds * fps
 
 
+# Keys holding live DaVinci Resolve objects, which can't be serialized.
+_BMD_KEYS = frozenset({"bmd_item", "bmd_mpi", "bmd_media_pool_item"})
+
+
+def _strip_bmd(obj: Dict[str, Any], placeholder_key: str, placeholder: str):
+    """Returns a shallow copy of obj without BMD objects, adding a placeholder."""
+    stripped = {k: v for k, v in obj.items() if k not in _BMD_KEYS}
+    if len(stripped) != len(obj):
+        stripped[placeholder_key] = placeholder
+    return stripped
+
+
 def make_project_data_serializable(
     original_project_data: Any,
 ) -> Dict[str, Any]:
     """
-    Creates a deep, serializable copy of ProjectData, replacing or removing
-    non-serializable DaVinci Resolve objects.
+    Creates a serializable copy of ProjectData, replacing non-serializable
+    DaVinci Resolve objects with placeholders. Only the containers along the
+    way are rebuilt; everything else is shared with the original.
     """
-    serializable_data = copy.deepcopy(original_project_data)  # Start with a deep copy
+    serializable_data = dict(original_project_data)
 
     # Process Timeline field
-    if "timeline" in serializable_data:
-        for track_type_key in ["video_track_items", "audio_track_items"]:
-            if track_type_key in serializable_data["timeline"]:
-                for i, item in enumerate(serializable_data["timeline"][track_type_key]):
-                    if "bmd_item" in item:
-                        # Replace with something identifiable or just remove
-                        # For OTIO, often the source_file_path and frame info are more important
-                        item["bmd_item_placeholder"] = (
-                            f"ResolveTimelineItem_Track{item.get('track_index', 'N/A')}_Index{i}"
-                        )
-                        del item["bmd_item"]  # Or item["bmd_item"] = None
+    timeline = serializable_data.get("timeline")
+    if timeline is not None:
+        timeline = serializable_data["timeline"] = dict(timeline)
+        for track_type_key in ("video_track_items", "audio_track_items"):
+            items = timeline.get(track_type_key)
+            if items is not None:
+                timeline[track_type_key] = [
+                    _strip_bmd(
+                        item,
+                        "bmd_item_placeholder",
+                        f"ResolveTimelineItem_Track{item.get('track_index', 'N/A')}_Index{i}",
+                    )
+                    for i, item in enumerate(items)
+                ]
 
     # Process Files field
-    if "files" in serializable_data:
-        for file_path_key, file_data_dict in serializable_data["files"].items():
+    files = serializable_data.get("files")
+    if files is not None:
+        serializable_files = serializable_data["files"] = {}
+        for file_path_key, file_data_dict in files.items():
+            file_data_dict = serializable_files[file_path_key] = dict(file_data_dict)
+
             # Process FileSource within FileData
-            if (
-                "fileSource" in file_data_dict
-                and "bmd_media_pool_item" in file_data_dict["fileSource"]
-            ):
-                # Replace with placeholder or path, or just remove
-                file_data_dict["fileSource"]["bmd_media_pool_item_placeholder"] = (
-                    f"ResolveMediaPoolItem_SourcePath_{file_data_dict['fileSource'].get('file_path', 'N/A')}"
+            file_source = file_data_dict.get("fileSource")
+            if file_source is not None:
+                file_data_dict["fileSource"] = _strip_bmd(
+                    file_source,
+                    "bmd_media_pool_item_placeholder",
+                    f"ResolveMediaPoolItem_SourcePath_{file_source.get('file_path', 'N/A')}",
                 )
-                del file_data_dict["fileSource"]["bmd_media_pool_item"]  # Or = None
 
             # Process TimelineItems within FileData
-            if "timelineItems" in file_data_dict:
-                for i, item in enumerate(file_data_dict["timelineItems"]):
-                    if "bmd_item" in item:
-                        item["bmd_item_placeholder"] = (
-                            f"ResolveTimelineItem_InFileData_File_{file_path_key}_Index{i}"
-                        )
-                        del item["bmd_item"]  # Or item["bmd_item"] = None
+            items = file_data_dict.get("timelineItems")
+            if items is not None:
+                file_data_dict["timelineItems"] = [
+                    _strip_bmd(
+                        item,
+                        "bmd_item_placeholder",
+                        f"ResolveTimelineItem_InFileData_File_{file_path_key}_Index{i}",
+                    )
+                    for i, item in enumerate(items)
+                ]
 
     return serializable_data
 
@@ -131,7 +200,7 @@ def is_valid_audio(filepath: str) -> bool:
     if not os.path.exists(filepath):
         return False
     try:
-        result: CompletedProcess[str] = subprocess.run(
+        result: CompletedProcess[bytes] = subprocess.run(
             [
                 "ffprobe",
                 "-v",
@@ -143,9 +212,9 @@ def is_valid_audio(filepath: str) -> bool:
                 filepath,
             ],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stderr=subprocess.DEVNULL,
         )
+        # float() parses the raw bytes directly, no text decoding needed.
         duration = float(result.stdout.strip())
         return duration > 0.1
     except Exception as e:
@@ -160,10 +229,44 @@ def export_to_json(data: Any, output_path: str) -> None:
     # make output dir if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+    if orjson is not None:
+        with open(output_path, "wb") as json_file:
+            json_file.write(
+                orjson.dumps(
+                    data,
+                    default=fallback_serializer,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        return
+
     with open(output_path, "w", encoding="utf-8") as json_file:
         json.dump(data, json_file, indent=4, default=fallback_serializer)
 
 
+def _fallback_serializer(obj: Any) -> Any:
+    """Serializes objects that JSON can't handle natively, e.g. BMD proxies."""
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serializes data to UTF-8 encoded JSON, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_fallback_serializer, option=orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, default=_fallback_serializer).encode("utf-8")
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parses UTF-8 encoded JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def send_message(message_type, payload=None):
     """Sends a structured message to stdout."""
     message = {"type": message_type, "payload": payload}
@@ -219,6 +322,7 @@ class TimelineItem(TypedDict):
     name: str
     id: str
     track_type: Literal["video", "audio", "subtitle"]
+    media_type: int  # 1 for video, 2 for audio, as used by the Resolve API
     track_index: int
     source_file_path: str
     processed_file_name: Optional[str]
@@ -242,6 +346,7 @@ def make_empty_timeline_item() -> TimelineItem:
         "name": "",
         "id": "",
         "track_type": "video",  # or some default
+        "media_type": 1,
         "track_index": 0,
         "source_file_path": "",
         "processed_file_name": None,
@@ -334,6 +439,11 @@ TASKS: dict[str, int] = {
 }
 
 
+# Shared read-only fallback for missing OTIO sub-objects, so lookups like
+# `(x.get("metadata") or _EMPTY_DICT).get(...)` don't allocate a dict per miss.
+_EMPTY_DICT: Any = MappingProxyType({})
+
+
 def _create_nested_audio_item_from_otio(
     otio_clip: Dict[str, Any],
     clip_start_in_container: float,
@@ -344,7 +454,7 @@ def _create_nested_audio_item_from_otio(
     (REVISED) Parses an OTIO clip, correctly converting RationalTime values
     into the timeline's frame rate domain.
     """
-    media_refs = otio_clip.get("media_references", {})
+    media_refs = otio_clip.get("media_references") or _EMPTY_DICT
     if not media_refs:
         return None
 
@@ -361,9 +471,9 @@ def _create_nested_audio_item_from_otio(
         return None
 
     if source_path_uri.startswith("file://"):
-        source_file_path = os.path.normpath(source_path_uri[7:])
+        source_file_path = _norm_path(source_path_uri[7:])
     else:
-        source_file_path = os.path.normpath(source_path_uri)
+        source_file_path = _norm_path(source_path_uri)
 
     source_uuid = uuid_from_path(source_file_path).hex
 
@@ -373,9 +483,9 @@ def _create_nested_audio_item_from_otio(
         return None
 
     # --- RATIONAL TIME CONVERSION ---
-    clip_start_rt = source_range.get("start_time", {})
-    clip_duration_rt = source_range.get("duration", {})
-    media_start_rt = available_range.get("start_time", {})
+    clip_start_rt = source_range.get("start_time") or _EMPTY_DICT
+    clip_duration_rt = source_range.get("duration") or _EMPTY_DICT
+    media_start_rt = available_range.get("start_time") or _EMPTY_DICT
 
     # Get values, using timeline_fps as a fallback for the rate
     clip_start_val = clip_start_rt.get("value", 0.0)
@@ -398,9 +508,10 @@ def _create_nested_audio_item_from_otio(
     duration_frames = duration_sec * timeline_fps
 
     source_channel: SourceChannel = {"stream_idx": 1, "channel_idx": 0}
-    processed_file_name = f"{source_uuid}.wav"
+    processed_file_name = sys.intern(f"{source_uuid}.wav")
 
-    resolve_meta = otio_clip.get("metadata", {}).get("Resolve_OTIO", {})
+    metadata = otio_clip.get("metadata") or _EMPTY_DICT
+    resolve_meta = metadata.get("Resolve_OTIO") or _EMPTY_DICT
     mapping_str = resolve_meta.get("AudioMapping")
 
     if mapping_str:
@@ -426,11 +537,12 @@ def _create_nested_audio_item_from_otio(
                         "stream_idx": stream_idx,
                         "channel_idx": ffmpeg_ch,
                     }
-                    processed_file_name = f"{source_uuid}_ch{ffmpeg_ch}.wav"
+                    processed_file_name = sys.intern(f"{source_uuid}_ch{ffmpeg_ch}.wav")
         except Exception as e:
             logging.warning(
-                f"Could not parse audio mapping for '{otio_clip.get('name')}'. "
-                f"Defaulting to mono mixdown. Error: {e}"
+                "Could not parse audio mapping for '%s'. Defaulting to mono mixdown. Error: %s",
+                otio_clip.get("name"),
+                e,
             )
 
     nested_item: NestedAudioTimelineItem = {
@@ -448,6 +560,22 @@ def _create_nested_audio_item_from_otio(
     return nested_item
 
 
+# Only the latest export is ever read, so keep just that one parsed document.
+@functools.lru_cache(maxsize=1)
+def _load_otio_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return load_json_bytes(f.read())
+
+
+def load_otio(path: str) -> Dict[str, Any]:
+    """
+    Parses an OTIO file, reusing the previous result while the file is
+    unchanged. The returned dict is shared between callers; treat it as read-only.
+    """
+    st = os.stat(path)
+    return _load_otio_cached(path, st.st_mtime_ns, st.st_size)
+
+
 def _recursive_otio_parser(
     otio_composable: Dict[str, Any],
     timeline_fps: float,
@@ -455,71 +583,82 @@ def _recursive_otio_parser(
     container_duration: Optional[float] = None,
 ) -> List[NestedAudioTimelineItem]:
     """
-    Recursively traverses an OTIO composable, respecting both Multicam
-    active angles and container duration constraints.
+    Traverses an OTIO composable and its nested stacks, respecting both
+    Multicam active angles and container duration constraints. Uses an explicit
+    stack instead of recursion; clips are returned in the same order.
     """
     found_clips: List[NestedAudioTimelineItem] = []
 
-    for track in otio_composable.get("children", []):
-        if track.get("kind", "").lower() != "audio":
+    # One frame per composable being walked:
+    # [tracks iterator, current track's items iterator, playhead, record offset]
+    stack: List[List[Any]] = [
+        [iter(otio_composable.get("children") or ()), None, 0.0, 0.0]
+    ]
+    while stack:
+        frame = stack[-1]
+        tracks, track_items, playhead, offset = frame
+
+        if track_items is None:
+            track = next(tracks, None)
+            if track is None:
+                stack.pop()
+                continue
+            if track.get("kind", "").lower() != "audio":
+                continue
+            # FIX 2: For Multicam clips, only process the single active audio track.
+            if active_angle_name and track.get("name") != active_angle_name:
+                continue
+            frame[1] = iter(track.get("children") or ())
+            frame[2] = 0.0
             continue
 
-        # FIX 2: For Multicam clips, only process the single active audio track.
-        if active_angle_name and track.get("name") != active_angle_name:
+        item_in_track = next(track_items, None)
+        if item_in_track is None:
+            frame[1] = None
             continue
 
-        playhead = 0.0
-        for item_in_track in track.get("children", []):
-            # if container_duration is not None and playhead >= container_duration:
-            #     break
+        schema = str(item_in_track.get("OTIO_SCHEMA", "")).lower()
+        source_range = item_in_track.get("source_range") or _EMPTY_DICT
+        item_duration = (source_range.get("duration") or _EMPTY_DICT).get("value", 0.0)
+        frame[2] = playhead + item_duration
 
-            schema = str(item_in_track.get("OTIO_SCHEMA", "")).lower()
-            item_duration = (
-                (item_in_track.get("source_range") or {})
-                .get("duration", {})
-                .get("value", 0.0)
-            )
-
-            effective_duration = item_duration
-            if container_duration is not None:
-                remaining_time = container_duration - playhead
-                if item_duration > remaining_time:
-                    effective_duration = max(0, remaining_time)
-
-            if "gap" in schema:
-                playhead += item_duration
-                continue
+        if "gap" in schema:
+            continue
 
-            # if effective_duration <= 0:
-            #     playhead += item_duration
-            #     continue
+        effective_duration = item_duration
+        if container_duration is not None:
+            remaining_time = container_duration - playhead
+            if item_duration > remaining_time:
+                effective_duration = max(0, remaining_time)
+
+        if "clip" in schema:
+            item = _create_nested_audio_item_from_otio(
+                item_in_track,
+                playhead,
+                timeline_fps,
+                max_duration=effective_duration,
+            )
+            if item:
+                item["start_frame"] += offset
+                item["end_frame"] += offset
+                found_clips.append(item)
+
+        elif "stack" in schema:
+            # Walk the nested stack next, with both constraints passed down.
+            stack.append(
+                [
+                    iter(item_in_track.get("children") or ()),
+                    None,
+                    0.0,
+                    offset + playhead,
+                ]
+            )
 
-            if "clip" in schema:
-                item = _create_nested_audio_item_from_otio(
-                    item_in_track,
-                    playhead,
-                    timeline_fps,
-                    max_duration=effective_duration,
-                )
-                if item:
-                    found_clips.append(item)
-
-            elif "stack" in schema:
-                # Pass both constraints down in the recursion.
-                nested_clips = _recursive_otio_parser(
-                    item_in_track,
-                    timeline_fps,
-                    active_angle_name=active_angle_name,
-                    container_duration=container_duration,
-                )
-                for nested_clip in nested_clips:
-                    nested_clip["start_frame"] += playhead
-                    nested_clip["end_frame"] += playhead
-                    found_clips.append(nested_clip)
+    return found_clips
 
-            playhead += item_duration
 
-    return found_clips
+# Active multicam angle, as it appears in the name of a Multicam Clip.
+_ANGLE_RE = re.compile(r"Angle \d+")
 
 
 def populate_nested_clips(input_otio_path: str) -> None:
@@ -535,22 +674,38 @@ def populate_nested_clips(input_otio_path: str) -> None:
         return
 
     try:
-        with open(input_otio_path, "r", encoding="utf-8") as f:
-            otio_data = json.load(f)
+        otio_data = load_otio(input_otio_path)
     except (IOError, json.JSONDecodeError) as e:
-        logging.error(f"Failed to read or parse OTIO file at {input_otio_path}: {e}")
+        logging.error("Failed to read or parse OTIO file at %s: %s", input_otio_path, e)
         return
 
     pd_timeline = project_data["timeline"]
-    all_pd_items = pd_timeline.get("video_track_items", []) + pd_timeline.get(
-        "audio_track_items", []
-    )
     timeline_start_frame = float(
         otio_data.get("global_start_time", {}).get("value", 0.0)
     )
     FRAME_MATCH_TOLERANCE = 0.5
     audio_track_counter = 0
 
+    # Items that can hold nested clips, indexed by (track_index, name) and sorted
+    # by start frame, so each OTIO stack is matched with a binary search.
+    stack_items_index: Dict[Tuple[Any, Any], List[TimelineItem]] = {}
+    for pd_item in chain(
+        pd_timeline.get("video_track_items", ()),
+        pd_timeline.get("audio_track_items", ()),
+    ):
+        if pd_item.get("type"):
+            key = (pd_item.get("track_index"), pd_item.get("name"))
+            stack_items_index.setdefault(key, []).append(pd_item)
+    stack_items_by_start: Dict[
+        Tuple[Any, Any], Tuple[List[float], List[TimelineItem]]
+    ] = {}
+    for key, key_items in stack_items_index.items():
+        key_items.sort(key=lambda x: x.get("start_frame", -1))
+        stack_items_by_start[key] = (
+            [x.get("start_frame", -1) for x in key_items],
+            key_items,
+        )
+
     for track in otio_data.get("tracks", {}).get("children", []):
         if track.get("kind", "").lower() != "audio":
             continue
@@ -559,9 +714,10 @@ def populate_nested_clips(input_otio_path: str) -> None:
         current_track_index = audio_track_counter
 
         playhead_frames = 0
-        for item in track.get("children", []):
-            duration_val = (
-                (item.get("source_range") or {}).get("duration", {}).get("value", 0.0)
+        for item in track.get("children") or ():
+            source_range = item.get("source_range") or _EMPTY_DICT
+            duration_val = (source_range.get("duration") or _EMPTY_DICT).get(
+                "value", 0.0
             )
             item_schema = str(item.get("OTIO_SCHEMA", "")).lower()
 
@@ -573,20 +729,25 @@ def populate_nested_clips(input_otio_path: str) -> None:
                 container_duration = duration_val
 
                 # FIX 2 (RESTORED): Check for multicam clips and get active angle.
-                resolve_meta = item.get("metadata", {}).get("Resolve_OTIO", {})
+                metadata = item.get("metadata") or _EMPTY_DICT
+                resolve_meta = metadata.get("Resolve_OTIO") or _EMPTY_DICT
                 sequence_type = resolve_meta.get("Sequence Type")
                 active_angle_name = None
                 if sequence_type == "Multicam Clip":
                     item_name = item.get("name", "")
-                    match = re.search(r"Angle \d+", item_name)
+                    match = (
+                        _ANGLE_RE.search(item_name) if "Angle " in item_name else None
+                    )
                     if match:
                         active_angle_name = match.group(0)
                         logging.info(
-                            f"Detected Multicam clip. Active audio angle: '{active_angle_name}'"
+                            "Detected Multicam clip. Active audio angle: '%s'",
+                            active_angle_name,
                         )
                     else:
                         logging.warning(
-                            f"Could not parse active angle from Multicam name: '{item_name}'."
+                            "Could not parse active angle from Multicam name: '%s'.",
+                            item_name,
                         )
 
                 nested_clips_for_this_instance = _recursive_otio_parser(
@@ -601,21 +762,25 @@ def populate_nested_clips(input_otio_path: str) -> None:
                     otio_item_name = item.get("name")
 
                     # FIX 3: Use high-specificity matching to prevent data collision.
-                    corresponding_pd_items = [
-                        pd_item
-                        for pd_item in all_pd_items
-                        if (
-                            pd_item.get("type")
-                            and pd_item.get("track_index") == current_track_index
-                            and abs(pd_item.get("start_frame", -1) - record_frame_float)
-                            < FRAME_MATCH_TOLERANCE
-                            and pd_item.get("name") == otio_item_name
+                    corresponding_pd_items: List[TimelineItem] = []
+                    candidates = stack_items_by_start.get(
+                        (current_track_index, otio_item_name)
+                    )
+                    if candidates:
+                        starts, key_items = candidates
+                        lo = bisect_right(
+                            starts, record_frame_float - FRAME_MATCH_TOLERANCE
                         )
-                    ]
+                        hi = bisect_left(
+                            starts, record_frame_float + FRAME_MATCH_TOLERANCE
+                        )
+                        corresponding_pd_items = key_items[lo:hi]
 
                     if not corresponding_pd_items:
                         logging.warning(
-                            f"Could not find corresponding project item for OTIO stack '{otio_item_name}' on track {current_track_index}"
+                            "Could not find corresponding project item for OTIO stack '%s' on track %s",
+                            otio_item_name,
+                            current_track_index,
                         )
 
                     for pd_item in corresponding_pd_items:
@@ -676,14 +841,19 @@ def process_track_items(
     """
     FRAME_MATCH_TOLERANCE = 0.5
     playhead_frames = 0.0
+    # Only items on this track can match, so filter them once up front.
+    track_pd_items = [
+        pd_item
+        for pd_item in pd_timeline.get(pd_timeline_key, [])
+        if pd_item.get("track_index") == track_index
+    ]
 
     for item in items:
         if not item:
             continue
         item_schema = str(item.get("OTIO_SCHEMA", "")).lower()
-        duration_val = (
-            (item.get("source_range") or {}).get("duration", {}).get("value", 0)
-        )
+        source_range = item.get("source_range") or _EMPTY_DICT
+        duration_val = (source_range.get("duration") or _EMPTY_DICT).get("value", 0)
 
         if "gap" in item_schema:
             playhead_frames += duration_val
@@ -696,7 +866,7 @@ def process_track_items(
             # Find all project data items that correspond to this OTIO item.
             # A compound clip will match both its video and audio parts.
             corresponding_items = find_closest_match(
-                pd_timeline.get(pd_timeline_key, []),
+                track_pd_items,
                 record_frame_float,
                 duration_val,
                 track_index,
@@ -704,16 +874,22 @@ def process_track_items(
 
             if not corresponding_items:
                 logging.warning(
-                    f"Could not find a corresponding project item for OTIO item at frame {record_frame_float} on track {track_index}"
+                    "Could not find a corresponding project item for OTIO item at frame %s on track %s",
+                    record_frame_float,
+                    track_index,
                 )
                 playhead_frames += duration_val
                 continue
 
-            link_group_id = (
-                item.get("metadata", {}).get("Resolve_OTIO", {}).get("Link Group ID")
+            metadata = item.get("metadata") or _EMPTY_DICT
+            link_group_id = (metadata.get("Resolve_OTIO") or _EMPTY_DICT).get(
+                "Link Group ID"
             )
-            print(
-                f"Processing item '{item.get('name')}' on track {track_index} with link group ID: {link_group_id}"
+            logging.debug(
+                "Processing item '%s' on track %s with link group ID: %s",
+                item.get("name"),
+                track_index,
+                link_group_id,
             )
 
             if link_group_id is not None:
@@ -776,7 +952,9 @@ def unify_edit_instructions(
         source_fps = item.get("source_fps")
         if not source_fps or source_fps < 1e-9:
             logging.warning(
-                f"Item '{item.get('id')}' has invalid source_fps. Assuming project_fps ({project_fps})."
+                "Item '%s' has invalid source_fps. Assuming project_fps (%s).",
+                item.get("id"),
+                project_fps,
             )
             source_fps = project_fps
 
@@ -792,60 +970,50 @@ def unify_edit_instructions(
                 proj_start = edit["source_start_frame"] * conversion_ratio
                 proj_end = edit["source_end_frame"] * conversion_ratio
                 is_enabled = edit.get("enabled", True)
-                # Create start/end "event points" with enabled status
-                events.append((proj_start, 1, is_enabled))  # Type 1 for start
-                events.append((proj_end, -1, is_enabled))  # Type -1 for end
+                # Create start/end "event points" with enabled status. The
+                # second field is 0 for a start and 1 for an end, so a plain
+                # tuple sort orders starts before ends on the same frame.
+                events.append((proj_start, 0, is_enabled))
+                events.append((proj_end, 1, is_enabled))
 
     if not events:
         return []
 
-    events.sort(key=lambda x: (x[0], -x[1]))
+    events.sort()
 
-    merged_segments = []
+    # Segments as [start, end, enabled] lists. A new segment that directly
+    # continues the previous one with the same 'enabled' status is stitched onto
+    # it in place, so no separate coalescing pass is needed.
+    merged_segments: List[List[Any]] = []
     active_enabled_count = 0
     active_disabled_count = 0
     last_frame = events[0][0]
 
-    for frame, type_val, is_enabled in events:
-        segment_duration = frame - last_frame
-        if segment_duration > 1e-9:
+    for frame, is_end, is_enabled in events:
+        if frame - last_frame > 1e-9 and (
+            active_enabled_count or active_disabled_count
+        ):
             is_segment_enabled = active_enabled_count > 0
-            is_segment_active = active_enabled_count > 0 or active_disabled_count > 0
-            if is_segment_active:
-                merged_segments.append((last_frame, frame, is_segment_enabled))
-
-        if type_val == 1:
-            if is_enabled:
-                active_enabled_count += 1
-            else:
-                active_disabled_count += 1
-        else:
-            if is_enabled:
-                active_enabled_count -= 1
+            if (
+                merged_segments
+                and abs(last_frame - merged_segments[-1][1]) < 1e-9
+                and merged_segments[-1][2] == is_segment_enabled
+            ):
+                merged_segments[-1][1] = frame
             else:
-                active_disabled_count -= 1
-        last_frame = frame
-
-    if not merged_segments:
-        return []
+                merged_segments.append([last_frame, frame, is_segment_enabled])
 
-    # Coalesce adjacent segments with the same 'enabled' status
-    final_edits = []
-    current_start, current_end, current_enabled = merged_segments[0]
-    for next_start, next_end, next_enabled in merged_segments[1:]:
-        if abs(next_start - current_end) < 1e-9 and next_enabled == current_enabled:
-            current_end = next_end
+        delta = -1 if is_end else 1
+        if is_enabled:
+            active_enabled_count += delta
         else:
-            final_edits.append((current_start, current_end, current_enabled))
-            current_start, current_end, current_enabled = (
-                next_start,
-                next_end,
-                next_enabled,
-            )
-    final_edits.append((current_start, current_end, current_enabled))
+            active_disabled_count += delta
+        last_frame = frame
 
     min_duration_in_frames = 1.0  # Minimum duration in project_fps domain
-    return [(s, e, en) for s, e, en in final_edits if (e - s) >= min_duration_in_frames]
+    return [
+        (s, e, en) for s, e, en in merged_segments if (e - s) >= min_duration_in_frames
+    ]
 
 
 def unify_linked_items_in_project_data(input_otio_path: str) -> None:
@@ -868,13 +1036,12 @@ def unify_linked_items_in_project_data(input_otio_path: str) -> None:
         logging.warning("Timeline or Project FPS not found or invalid. Cannot unify.")
         return
 
-    logging.info(f"Using Timeline FPS: {timeline_fps}, Project FPS: {project_fps}")
+    logging.info("Using Timeline FPS: %s, Project FPS: %s", timeline_fps, project_fps)
 
     try:
-        with open(input_otio_path, "r", encoding="utf-8") as f:
-            otio_data = json.load(f)
+        otio_data = load_otio(input_otio_path)
     except (IOError, json.JSONDecodeError) as e:
-        logging.error(f"Failed to read or parse OTIO file at {input_otio_path}: {e}")
+        logging.error("Failed to read or parse OTIO file at %s: %s", input_otio_path, e)
         return
 
     # The following block populates the project data from the OTIO file and
@@ -905,26 +1072,28 @@ def unify_linked_items_in_project_data(input_otio_path: str) -> None:
             ),
         )
 
-    all_pd_items = pd_timeline.get("video_track_items", []) + pd_timeline.get(
-        "audio_track_items", []
-    )
-
     items_by_link_group: Dict[int, List[TimelineItem]] = {}
-    for item in all_pd_items:
+    unlinked_edited_items: List[TimelineItem] = []
+    for item in chain(
+        pd_timeline.get("video_track_items", ()),
+        pd_timeline.get("audio_track_items", ()),
+    ):
         link_group_id = item.get("link_group_id")
         if link_group_id is not None:
             items_by_link_group.setdefault(link_group_id, []).append(item)
+        elif item.get("edit_instructions"):
+            unlinked_edited_items.append(item)
 
     next_new_group_id = max_link_group_id + 1
-    for item in all_pd_items:
-        if item.get("link_group_id") is None and item.get("edit_instructions"):
-            logging.info(
-                f"Item '{item.get('name', 'Unnamed')}' has edits but no link_group_id. "
-                f"Assigning new group ID {next_new_group_id}"
-            )
-            item["link_group_id"] = next_new_group_id
-            items_by_link_group[next_new_group_id] = [item]
-            next_new_group_id += 1
+    for item in unlinked_edited_items:
+        logging.info(
+            "Item '%s' has edits but no link_group_id. Assigning new group ID %s",
+            item.get("name", "Unnamed"),
+            next_new_group_id,
+        )
+        item["link_group_id"] = next_new_group_id
+        items_by_link_group[next_new_group_id] = [item]
+        next_new_group_id += 1
 
     # Main processing loop with new unification logic
     for link_id, group_items in items_by_link_group.items():
@@ -941,7 +1110,7 @@ def unify_linked_items_in_project_data(input_otio_path: str) -> None:
 
             # If no item has edits, there's nothing to do.
             if not template_item:
-                logging.info(f"Group {link_id} has no edits to unify. Skipping.")
+                logging.info("Group %s has no edits to unify. Skipping.", link_id)
                 continue
 
             template_instructions = template_item["edit_instructions"]
@@ -950,58 +1119,67 @@ def unify_linked_items_in_project_data(input_otio_path: str) -> None:
                 template_fps = project_fps
 
             logging.info(
-                f"Group {link_id}: Applying template edits from item '{template_item['id']}'."
+                "Group %s: Applying template edits from item '%s'.",
+                link_id,
+                template_item["id"],
             )
 
+            # Template source ranges in seconds, computed once for all targets.
+            template_secs = [
+                (
+                    inst["source_start_frame"] / template_fps,
+                    inst["source_end_frame"] / template_fps,
+                    inst,
+                )
+                for inst in template_instructions
+            ]
+
             for target_item in group_items:
                 # The template item itself is already correct.
                 if target_item["id"] == template_item["id"]:
                     continue
 
-                new_instructions = []
                 target_fps = target_item.get("source_fps", project_fps)
                 if target_fps < 1e-9:
                     target_fps = project_fps
 
-                for inst in template_instructions:
-                    # Convert template source range -> seconds -> target source range
-                    start_sec = inst["source_start_frame"] / template_fps
-                    end_sec = inst["source_end_frame"] / template_fps
-
-                    new_src_start = start_sec * target_fps
-                    new_src_end = end_sec * target_fps
-
-                    new_instructions.append(
-                        {
-                            # Recalculate source frames for the target's FPS
-                            "source_start_frame": new_src_start,
-                            "source_end_frame": new_src_end,
-                            # Preserve the exact timeline placement from the template
-                            "start_frame": inst["start_frame"],
-                            "end_frame": inst["end_frame"],
-                            "enabled": inst["enabled"],
-                        }
-                    )
+                # Convert template source range -> seconds -> target source range
+                new_instructions = [
+                    {
+                        # Recalculate source frames for the target's FPS
+                        "source_start_frame": start_sec * target_fps,
+                        "source_end_frame": end_sec * target_fps,
+                        # Preserve the exact timeline placement from the template
+                        "start_frame": inst["start_frame"],
+                        "end_frame": inst["end_frame"],
+                        "enabled": inst["enabled"],
+                    }
+                    for start_sec, end_sec, inst in template_secs
+                ]
 
                 target_item["edit_instructions"] = new_instructions
                 logging.info(
-                    f"Copied {len(new_instructions)} edits to item '{target_item['id']}'."
+                    "Copied %d edits to item '%s'.",
+                    len(new_instructions),
+                    target_item["id"],
                 )
 
         # Case 2: Complex Merge (multiple items have conflicting edits).
         # We fall back to the full unification logic that rebuilds the timeline.
         else:
             logging.warning(
-                f"Group {link_id}: Found {len(edited_items)} items with edits. "
-                "Performing complex merge. Minor frame shifts may occur due to recalculation."
+                "Group %s: Found %d items with edits. "
+                "Performing complex merge. Minor frame shifts may occur due to recalculation.",
+                link_id,
+                len(edited_items),
             )
             unified_edits_proj_domain = unify_edit_instructions(
                 group_items, project_fps
             )
 
+            # group_items is never empty here (empty groups are skipped above).
             group_timeline_anchor = min(
-                (item.get("start_frame", float("inf")) for item in group_items),
-                default=0.0,
+                [item.get("start_frame", float("inf")) for item in group_items]
             )
 
             final_timeline_segments = []
@@ -1053,39 +1231,80 @@ def unify_linked_items_in_project_data(input_otio_path: str) -> None:
 
                 item["edit_instructions"] = new_edit_instructions
                 logging.info(
-                    f"Updated item '{item['id']}' in group {link_id} with {len(new_edit_instructions)} merged edits."
+                    "Updated item '%s' in group %s with %d merged edits.",
+                    item["id"],
+                    link_id,
+                    len(new_edit_instructions),
                 )
 
 
 class ProgressTracker:
+    # Minimum time between two progress messages to Go, in seconds.
+    _MIN_INTERVAL = 0.125
+
     def __init__(self):
         """
-        Initializes the tracker and a background thread pool for sending updates.
+        Initializes the tracker and a background thread for sending updates.
         """
         self.task_id = ""
         self._tasks = {}
         self._total_weight = 0.0
         self._task_progress = {}
-        self._last_report: float = time()
 
-        # 1. Create a thread pool that will handle our HTTP requests.
-        #    max_workers can be tuned, but 2-3 is fine for this kind of task.
-        self._executor = ThreadPoolExecutor(
-            max_workers=3, thread_name_prefix="ProgressUpdater"
+        # Routine updates are handed to a background thread. Only the latest
+        # one is kept, so a burst of updates becomes one message to Go.
+        # Important updates are queued right away, in order with whatever the
+        # caller queues next. A routine update may still be waiting, so
+        # send_message_to_go calls flush() before queueing a task result.
+        # shutdown() is called at exit by _shutdown_go_messaging.
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[str, float, str]] = None
+        self._last_sent = 0.0
+        self._stopping = False
+        self._sender = threading.Thread(
+            target=self._send_loop, name="ProgressUpdater", daemon=True
         )
-
-        # 2. Register a function to be called when the program exits to ensure
-        #    threads are cleaned up gracefully.
-        atexit.register(self.shutdown)
+        self._sender.start()
 
     def shutdown(self):
-        """Shuts down the thread pool executor."""
+        """Stops the sender thread after it has sent any pending update."""
         print("\nShutting down progress updater threads...")
-        # wait=True ensures we wait for pending updates to be sent before exiting.
-        # Set to False if you want the program to exit immediately.
-        self._executor.shutdown(wait=True)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._sender.join(timeout=5)
         print("Shutdown complete.")
 
+    def flush(self):
+        """Queues the pending update for Go now instead of waiting."""
+        with self._cond:
+            if self._pending is not None:
+                self._send_pending()
+
+    def _send_pending(self):
+        """Queues the pending update for Go. Must be called holding _cond."""
+        send_progress_update(*self._pending)
+        self._pending = None
+        self._last_sent = time()
+
+    def _send_loop(self):
+        """Sends the latest pending update, at most once per _MIN_INTERVAL."""
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                # Let more updates coalesce until the interval has passed.
+                while not self._stopping:
+                    delay = self._MIN_INTERVAL - (time() - self._last_sent)
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                # An important update may have been sent in the meantime.
+                if self._pending is not None:
+                    self._send_pending()
+
     def start_new_run(self, weighted_tasks: dict[str, int], task_id: str):
         # This method's logic remains the same.
         print(f"Initializing tracker for Task ID: {task_id}")
@@ -1102,21 +1321,28 @@ class ProgressTracker:
         self._task_progress = {task: 0.0 for task in self._tasks}
         # self._report_progress("Initialized")
 
-    def _report_progress(self, message: str, important: bool = False):
+    def _report_progress(
+        self,
+        message: str,
+        important: bool = False,
+        percentage: Optional[float] = None,
+    ):
         """
-        Submits the send_progress_update function to the thread pool
-        to be executed in the background.
+        Reports the current progress. Important updates are queued for Go
+        right away, in order with what the caller sends next; others are left
+        to the sender thread. The caller never waits for the HTTP request.
         """
-        # 3. Instead of calling the function directly, submit it to the executor.
-        #    The main thread will not wait for this to complete.
-        if self.get_percentage() == 100.0:
+        if percentage is None:
+            percentage = self.get_percentage()
+        if percentage == 100.0:
             important = True  # Always report completion immediately
 
-        if (time() - self._last_report > 0.125) or important:
-            self._executor.submit(
-                send_progress_update, self.task_id, self.get_percentage(), message
-            )
-            self._last_report = time()
+        with self._cond:
+            self._pending = (self.task_id, percentage, message)
+            if important:
+                self._send_pending()
+            else:
+                self._cond.notify()
 
     def update_task_progress(
         self, task_name: str, percentage: float, message: str = ""
@@ -1134,10 +1360,11 @@ class ProgressTracker:
 
         self._task_progress[task_name] = self._tasks[task_name] * (percentage / 100.0)
         update_message = message if message is not None else task_name
-        print(
-            f"Updating '{task_name}' to {percentage:.1f}%. Overall: {self.get_percentage():.2f}%"
+        overall = self.get_percentage()
+        logging.debug(
+            "Updating '%s' to %.1f%%. Overall: %.2f%%", task_name, percentage, overall
         )
-        self._report_progress(update_message, important=important)
+        self._report_progress(update_message, important=important, percentage=overall)
 
     def complete_task(self, task_name: str):
         self.update_task_progress(task_name, 100.0)
@@ -1156,7 +1383,81 @@ class ProgressTracker:
 TRACKER = ProgressTracker()
 
 
-def send_message_to_go(message_type: str, payload: Any, task_id: Optional[str] = None):
+# Keep-alive connections to the Go server, one per sending thread. They are
+# closed when their thread goes away, or at exit for the ones still open.
+_go_conn_local = threading.local()
+_go_conns: "weakref.WeakSet[HTTPConnection]" = weakref.WeakSet()
+
+
+def _get_go_connection() -> HTTPConnection:
+    """Returns this thread's connection to the Go server, creating it if needed."""
+    conn = getattr(_go_conn_local, "conn", None)
+    if conn is None or conn.port != GO_SERVER_PORT:
+        if conn is not None:
+            conn.close()
+        conn = HTTPConnection("localhost", GO_SERVER_PORT, timeout=5)
+        _go_conn_local.conn = conn
+        _go_conns.add(conn)
+    return conn
+
+
+def _close_go_connections() -> None:
+    for conn in list(_go_conns):
+        conn.close()
+
+
+# Messages to Go are posted in order by a single background thread, so the
+# thread driving Resolve never waits on an HTTP round trip. None stops it.
+_OUTBOUND_Q: "queue.Queue[Optional[Tuple[str, Any, Optional[str]]]]" = queue.Queue()
+
+
+def _outbound_loop() -> None:
+    while True:
+        message = _OUTBOUND_Q.get()
+        if message is None:
+            return
+        _send_message_sync(*message)
+
+
+_outbound_sender = threading.Thread(
+    target=_outbound_loop, name="GoMessageSender", daemon=True
+)
+_outbound_sender.start()
+
+
+def _flush_outbound_messages() -> None:
+    """Sends everything still queued and stops the sender thread."""
+    _OUTBOUND_Q.put(None)
+    _outbound_sender.join(timeout=5)
+
+
+@atexit.register
+def _shutdown_go_messaging() -> None:
+    # One handler, so the order is explicit: the tracker queues its last
+    # update, the queue is drained, and only then are the connections closed.
+    TRACKER.shutdown()
+    _flush_outbound_messages()
+    _close_go_connections()
+
+
+def send_message_to_go(
+    message_type: str, payload: Any, task_id: Optional[str] = None
+) -> None:
+    """
+    Queues a message for the Go server. `payload` may be any JSON-serializable
+    object, or bytes that were already serialized with `dump_json_bytes`.
+    Messages are delivered in the order they were queued.
+    """
+    if message_type == "taskResult":
+        # Don't let a coalesced progress update arrive after the result.
+        TRACKER.flush()
+    _OUTBOUND_Q.put((message_type, payload, task_id))
+
+
+def _send_message_sync(
+    message_type: str, payload: Any, task_id: Optional[str] = None
+) -> bool:
+    """Posts a message to the Go server and reports whether Go accepted it."""
     global GO_SERVER_PORT
     global AUTH_TOKEN
 
@@ -1167,23 +1468,43 @@ def send_message_to_go(message_type: str, payload: Any, task_id: Optional[str] =
     # Use http.client for sending messages to Go
     conn = None
     try:
-        conn = HTTPConnection("localhost", GO_SERVER_PORT, timeout=5)
         auth_bearer = f"Bearer {AUTH_TOKEN}"
         headers = {"Content-Type": "application/json", "Authorization": auth_bearer}
 
-        # Helper to serialize objects that might not be directly JSON serializable
-        def fallback_serializer(obj):
-            if hasattr(obj, "__dict__"):
-                return obj.__dict__
-            return str(obj)  # Fallback to string representation
-
-        # Construct the message as expected by the Go backend
-        go_message = {"Type": message_type, "Payload": payload}
-        json_payload = json.dumps(go_message, default=fallback_serializer)
+        # Construct the message as expected by the Go backend. The payload is
+        # serialized once, straight to bytes, and spliced into the envelope.
+        payload_json = (
+            payload if isinstance(payload, bytes) else dump_json_bytes(payload)
+        )
+        # join() copies the (possibly large) payload once, where chained
+        # concatenation would copy it for every `+`.
+        json_payload = b"".join(
+            (
+                b'{"Type":',
+                dump_json_bytes(message_type),
+                b',"Payload":',
+                payload_json,
+                b"}",
+            )
+        )
+        headers["Content-Length"] = str(len(json_payload))
 
         path = f"/msg?task_id={task_id}" if task_id else "/msg"
-        conn.request("POST", path, body=json_payload, headers=headers)
-        response = conn.getresponse()
+        for attempt in range(2):
+            conn = _get_go_connection()
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", path, body=json_payload, headers=headers)
+                response = conn.getresponse()
+                # Read the whole body so the connection can be reused.
+                response_body = response.read()
+                break
+            except ConnectionError:
+                conn.close()
+                # Go may have closed an idle keep-alive connection; retry once
+                # on a fresh one.
+                if not reused or attempt:
+                    raise
 
         if response.status >= 200 and response.status < 300:
             print(
@@ -1192,15 +1513,14 @@ def send_message_to_go(message_type: str, payload: Any, task_id: Optional[str] =
             return True
         else:
             print(
-                f"Python (to Go): Error sending message type '{message_type}'. Go responded with status {response.status}: {response.read().decode()}"
+                f"Python (to Go): Error sending message type '{message_type}'. Go responded with status {response.status}: {response_body.decode()}"
             )
             return False
     except Exception as e:
         print(f"Python (to Go): HTTP error sending message type '{message_type}': {e}")
-        return False
-    finally:
         if conn:
             conn.close()
+        return False
 
 
 def resolve_import_error_msg(e: Exception, task_id: str = "") -> None:
@@ -1249,10 +1569,7 @@ def get_resolve(task_id: str = "") -> None:
     if davinci_folder_path_from_settings:
         # Normalize path and handle potential 'bin' directory for Linux
         normalized_path = os.path.normpath(davinci_folder_path_from_settings)
-        if (
-            sys.platform.startswith("linux")
-            and os.path.basename(normalized_path) == "bin"
-        ):
+        if IS_LINUX and os.path.basename(normalized_path) == "bin":
             # If it's /opt/resolve/bin, we want /opt/resolve
             normalized_path = os.path.dirname(normalized_path)
             print(
@@ -1260,18 +1577,18 @@ def get_resolve(task_id: str = "") -> None:
             )
 
         # Construct the full path to the scripting modules
-        if sys.platform.startswith("darwin"):
+        if IS_MAC:
             resolve_modules_path = os.path.join(
                 normalized_path,
                 "Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/",
             )
-        elif sys.platform.startswith("win") or sys.platform.startswith("cygwin"):
+        elif IS_WIN or sys.platform.startswith("cygwin"):
             # On Windows, the path from settings might be the Resolve install dir (e.g., C:\Program Files\Blackmagic Design\DaVinci Resolve)
             # We need to append the rest of the path
             resolve_modules_path = os.path.join(
                 normalized_path, "Support", "Developer", "Scripting", "Modules"
             )
-        elif sys.platform.startswith("linux"):
+        elif IS_LINUX:
             resolve_modules_path = os.path.join(
                 normalized_path, "Developer", "Scripting", "Modules"
             )
@@ -1279,9 +1596,9 @@ def get_resolve(task_id: str = "") -> None:
         print(f"Using davinciFolderPath from settings: {resolve_modules_path}")
     else:
         # Fallback to existing platform-specific paths if no path from settings or error
-        if sys.platform.startswith("darwin"):
+        if IS_MAC:
             resolve_modules_path = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
-        elif sys.platform.startswith("win") or sys.platform.startswith("cygwin"):
+        elif IS_WIN or sys.platform.startswith("cygwin"):
             resolve_modules_path = os.path.join(
                 str(os.getenv("PROGRAMDATA"))
                 if os.getenv("PROGRAMDATA") is not None
@@ -1293,7 +1610,7 @@ def get_resolve(task_id: str = "") -> None:
                 "Scripting",
                 "Modules",
             )
-        elif sys.platform.startswith("linux"):
+        elif IS_LINUX:
             resolve_modules_path = "/opt/resolve/Developer/Scripting/Modules/"
 
     if resolve_modules_path and resolve_modules_path not in sys.path:
@@ -1365,9 +1682,21 @@ def switch_to_page(page: ResolvePage) -> None:
 
 
 def get_items_by_tracktype(
-    track_type: Literal["video", "audio"], timeline: Any
+    track_type: Literal["video", "audio"],
+    timeline: Any,
+    mpi_cache: Optional[Dict[str, Tuple[str, Any, Any]]] = None,
 ) -> list[TimelineItem]:
+    """
+    Collects the items on every track of the given type.
+
+    `mpi_cache` maps a media pool item's unique id to its (File Path, FPS,
+    Type) clip properties. Pass the same dict to several calls to share it;
+    a source used by many timeline items is then only queried once.
+    """
     items: list[TimelineItem] = []
+    if mpi_cache is None:
+        mpi_cache = {}
+    media_type = 1 if track_type == "video" else 2
     track_count = timeline.GetTrackCount(track_type)
     for i in range(1, track_count + 1):
         track_items = timeline.GetItemListInTrack(track_type, i) or []
@@ -1380,13 +1709,26 @@ def get_items_by_tracktype(
             source_start_float = left_offset or 0
             source_end_float = (left_offset + duration) if left_offset else duration
 
-            source_file_path: str = (
-                media_pool_item.GetClipProperty("File Path") if media_pool_item else ""
-            )
+            clip_type = None
+            if media_pool_item:
+                mpi_id = media_pool_item.GetUniqueId()
+                mpi_props = mpi_cache.get(mpi_id)
+                if mpi_props is None:
+                    file_path = sys.intern(
+                        media_pool_item.GetClipProperty("File Path") or ""
+                    )
+                    mpi_props = mpi_cache[mpi_id] = (
+                        file_path,
+                        media_pool_item.GetClipProperty("FPS"),
+                        # Only needed for compound clips, generators and titles.
+                        None if file_path else media_pool_item.GetClipProperty("Type"),
+                    )
+                source_file_path, mpi_fps, clip_type = mpi_props
+            else:
+                source_file_path, mpi_fps = "", 30.0
 
             source_fps: float = (
-                (media_pool_item.GetClipProperty("FPS") if media_pool_item else 30.0)
-                or PROJECT_DATA.get("timeline", {}).get("project_fps", 30.0)
+                mpi_fps or PROJECT_DATA.get("timeline", {}).get("project_fps", 30.0)
                 if PROJECT_DATA
                 else 30.0
             )
@@ -1398,9 +1740,11 @@ def get_items_by_tracktype(
                 "name": item_name,
                 "edit_instructions": [],
                 "start_frame": start_frame,
-                "end_frame": item_bmd.GetEnd(True),
+                # GetEnd(True) is start + duration; skip the extra API call.
+                "end_frame": start_frame + duration,
                 "id": get_item_id(item_bmd, item_name, start_frame, track_type, i),
                 "track_type": track_type,
+                "media_type": media_type,
                 "track_index": i,
                 "source_fps": source_fps,
                 "source_file_path": source_file_path,
@@ -1415,7 +1759,6 @@ def get_items_by_tracktype(
             if media_pool_item and not source_file_path:
                 # This branch means it's likely a compound clip, generator, or title.
                 # Capture its type, and initialize nested_clips for later OTIO population.
-                clip_type = media_pool_item.GetClipProperty("Type")
                 # print(f"Detected clip type: {clip_type} for item: {item_name}")
                 timeline_item["type"] = clip_type
                 timeline_item["nested_clips"] = []  # Initialize as empty list
@@ -1425,6 +1768,21 @@ def get_items_by_tracktype(
     return items
 
 
+def _get_item_starts_by_track(
+    track_type: Literal["video", "audio"], timeline: Any
+) -> Dict[int, List[int]]:
+    """Return the start frame of every item, grouped by track index.
+
+    A lightweight alternative to get_items_by_tracktype for verification,
+    which only needs item positions and not the media pool metadata.
+    """
+    starts: Dict[int, List[int]] = {}
+    for i in range(1, timeline.GetTrackCount(track_type) + 1):
+        track_items = timeline.GetItemListInTrack(track_type, i) or []
+        starts[i] = [int(item_bmd.GetStart(True)) for item_bmd in track_items]
+    return starts
+
+
 def _verify_timeline_state(
     timeline: Any, expected_clips: List[Dict], attempt_num: int
 ) -> bool:
@@ -1446,56 +1804,45 @@ def _verify_timeline_state(
     MAX_FRAME_TOLERANCE = 1
 
     # Build expected cut list
-    expected_cuts = Counter()
+    expected_cuts: Dict[Tuple[int, int, int], int] = {}
     for clip in expected_clips:
         key = (clip["mediaType"], clip["trackIndex"], int(clip["recordFrame"]))
-        expected_cuts[key] += 1
-
-    # Get actual items from the timeline
-    actual_video_items = get_items_by_tracktype("video", timeline)
-    actual_audio_items = get_items_by_tracktype("audio", timeline)
-    actual_items = actual_video_items + actual_audio_items
-
-    # Build list of actual clip keys for fuzzy matching
-    actual_clips = defaultdict(list)
-    for item in actual_items:
-        media_type = 1 if item["track_type"] == "video" else 2
-        actual_clips[(media_type, item["track_index"])].append(int(item["start_frame"]))
-
-    matched = Counter()
-
-    for (media_type, track_index, expected_frame), count in expected_cuts.items():
-        actual_frames = actual_clips.get((media_type, track_index), [])
-        unmatched = actual_frames.copy()
-
-        for _ in range(count):
-            # Find the closest actual frame to the expected one
-            best_match = None
-            best_diff = float("inf")
-
-            for frame in unmatched:
-                diff = abs(frame - expected_frame)
-                if diff <= MAX_FRAME_TOLERANCE and diff < best_diff:
-                    best_match = frame
-                    best_diff = diff
-
-            if best_match is not None:
-                unmatched.remove(best_match)
-                matched[(media_type, track_index, expected_frame)] += 1
-                if best_diff > 0:
-                    print(
-                        f"  - Fuzzy match on {['video', 'audio'][media_type - 1]} track {track_index} at frame {expected_frame} (matched frame {best_match})"
-                    )
-            else:
-                # No suitable match found
-                continue
+        expected_cuts[key] = expected_cuts.get(key, 0) + 1
+
+    # Build sorted lists of actual clip start frames for fuzzy matching.
+    # Only positions are compared, so skip the full item metadata scan.
+    actual_clips: Dict[Tuple[int, int], List[int]] = {}
+    for media_type, track_type in ((1, "video"), (2, "audio")):
+        for track_index, frames in _get_item_starts_by_track(
+            track_type, timeline
+        ).items():
+            frames.sort()
+            actual_clips[(media_type, track_index)] = frames
+
+    # Counts are decremented in place; whatever remains above zero is missing.
+    for key, count in expected_cuts.items():
+        media_type, track_index, expected_frame = key
+        actual_frames = actual_clips.get((media_type, track_index), ())
+
+        # Only frames within the tolerance window can match; bisect to it
+        # instead of scanning the whole track. The closest frames win, and
+        # ties go to the earlier frame.
+        lo = bisect_left(actual_frames, expected_frame - MAX_FRAME_TOLERANCE)
+        hi = bisect_right(actual_frames, expected_frame + MAX_FRAME_TOLERANCE)
+        candidates = sorted(
+            actual_frames[lo:hi], key=lambda frame: abs(frame - expected_frame)
+        )[:count]
+
+        for best_match in candidates:
+            if best_match != expected_frame:
+                print(
+                    f"  - Fuzzy match on {['video', 'audio'][media_type - 1]} track {track_index} at frame {expected_frame} (matched frame {best_match})"
+                )
+
+        expected_cuts[key] = count - len(candidates)
 
     # Determine what's missing
-    missing = []
-    for key, count in expected_cuts.items():
-        found = matched.get(key, 0)
-        if found < count:
-            missing.append((key, count - found))
+    missing = [(key, count) for key, count in expected_cuts.items() if count > 0]
 
     if not missing:
         print(
@@ -1541,26 +1888,26 @@ def generate_uuid_from_nested_clips(
     # We must sort the clips to ensure the order is always the same,
     # otherwise the same content could produce different UUIDs.
     # We sort by the clip's start time within the container.
-    sorted_nested_clips = sorted(nested_clips, key=lambda x: x["start_frame"])
+    sorted_nested_clips = sorted(nested_clips, key=itemgetter("start_frame"))
 
-    nested_strings = []
-    for clip in sorted_nested_clips:
-        # Create a unique signature for each nested clip
-        clip_signature = (
+    # Combine a unique signature for each nested clip into the seed string.
+    seed_string += (
+        "nested_clips["
+        + "||".join(
             f"path:{clip['source_file_path']},"
             f"start:{clip['start_frame']},"
             f"end:{clip['end_frame']},"
             f"s_start:{clip['source_start_frame']},"
             f"s_end:{clip['source_end_frame']}"
+            for clip in sorted_nested_clips
         )
-        nested_strings.append(clip_signature)
-
-    # Combine all nested signatures into the main seed string
-    seed_string += "nested_clips[" + "||".join(nested_strings) + "]"
+        + "]"
+    )
 
     # 3. Generate a UUIDv5 hash from the canonical seed string.
     # UUIDv5 is perfect for this as it's designed to create a deterministic
-    # UUID from a name within a namespace.
+    # UUID from a name within a namespace. The result names the rendered
+    # mixdown on disk, so changing the hash would orphan existing renders.
     content_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, seed_string)
 
     return str(content_uuid)
@@ -1648,14 +1995,22 @@ def resolve_to_ffmpeg_channel(channel_idx: int, streams: list[dict]):
 
 
 def get_project_data(project, timeline) -> Tuple[bool, str | None]:
-    global PROJECT, MEDIA_POOL, TEMP_DIR, PROJECT_DATA
+    global PROJECT, MEDIA_POOL, TEMP_DIR, PROJECT_DATA, TIMELINE_OTIO_EXPORTED
+
+    TIMELINE_OTIO_EXPORTED = False
 
     # --- 1. Initial Data Gathering ---
     timeline_name = timeline.GetName()
     timeline_fps = timeline.GetSetting("timelineFrameRate")
     project_default_fps = project.GetSetting("timelineFrameRate")
-    video_track_items: list[TimelineItem] = get_items_by_tracktype("video", timeline)
-    audio_track_items: list[TimelineItem] = get_items_by_tracktype("audio", timeline)
+    # Video and audio items usually share sources; query each one only once.
+    mpi_cache: Dict[str, Tuple[str, Any, Any]] = {}
+    video_track_items: list[TimelineItem] = get_items_by_tracktype(
+        "video", timeline, mpi_cache
+    )
+    audio_track_items: list[TimelineItem] = get_items_by_tracktype(
+        "audio", timeline, mpi_cache
+    )
 
     tl_dict: Timeline = {
         "name": timeline_name,
@@ -1672,14 +2027,18 @@ def get_project_data(project, timeline) -> Tuple[bool, str | None]:
         "files": {},
     }
 
-    if any(item.get("type") for item in audio_track_items):
+    has_complex = any(item.get("type") for item in audio_track_items)
+    if has_complex:
         print("Complex clips found. Analyzing timeline structure with OTIO...")
         input_otio_path = os.path.join(TEMP_DIR, "temp-timeline.otio")
         export_timeline_to_otio(timeline, file_path=input_otio_path)
+        TIMELINE_OTIO_EXPORTED = True
         populate_nested_clips(input_otio_path)
 
     # --- 2. Analyze Mappings & Define Streams (Runs for BOTH modes) ---
     print("Analyzing timeline items and audio channel mappings...")
+    files = PROJECT_DATA["files"]
+    # Mappings and the files map are filled in the same pass over the items.
     for item in audio_track_items:
         if not item.get("source_file_path"):
             continue
@@ -1722,28 +2081,23 @@ def get_project_data(project, timeline) -> Tuple[bool, str | None]:
                 f"Warning: Could not get audio mapping for '{item['name']}'. Defaulting to mono mixdown. Error: {e}"
             )
 
-    # --- 3. Populate the 'files' map for data consistency ---
-    for item in audio_track_items:
-        source_path = item.get("source_file_path")
-        if not source_path:
-            continue
-
+        # --- 3. Populate the 'files' map for data consistency ---
         # If the file is not yet in our map, add it.
-        if source_path not in PROJECT_DATA["files"]:
-            PROJECT_DATA["files"][source_path] = {
+        if source_path not in files:
+            files[source_path] = {
                 "properties": {"FPS": timeline_fps},
                 "processed_audio_path": None,  # Added to satisfy TypedDict
                 "timelineItems": [],
                 "fileSource": {
                     "file_path": source_path,
-                    "uuid": uuid_from_path(source_path).hex,
+                    "uuid": source_uuid,
                     "bmd_media_pool_item": item["bmd_mpi"],
                 },
                 "silenceDetections": None,
             }
 
     # --- 4. Handle Compound Clips ---
-    if any(item.get("type") for item in audio_track_items):
+    if has_complex:
         print("Complex clips found...")
         mixdown_compound_clips(audio_track_items, [])
 
@@ -1763,13 +2117,21 @@ def apply_edits_from_go(
     print("Applying edit instructions from Go...")
     # pprint.pprint(source_project)
 
-    # Create an efficient lookup map of the audio items sent from Go.
+    # Create an efficient lookup of the edit instructions sent from Go. Items
+    # without instructions have nothing to copy, so they get no entry.
     source_audio_items = source_project.get("timeline", {}).get("audio_track_items", [])
-    source_items_by_id = {
-        item["id"]: item for item in source_audio_items if "id" in item
-    }
+    has_ids = False
+    edits_by_id = {}
+    for item in source_audio_items:
+        if "id" in item:
+            has_ids = True
+            if "edit_instructions" in item:
+                edits_by_id[item["id"]] = item["edit_instructions"]
+            else:
+                # A later duplicate without instructions shadows earlier ones.
+                edits_by_id.pop(item["id"], None)
 
-    if not source_items_by_id:
+    if not has_ids:
         print(
             "Warning: No audio items with IDs found in data from Go. No edits applied."
         )
@@ -1782,15 +2144,9 @@ def apply_edits_from_go(
     # Iterate through the target items and apply the source's edit instructions.
     for target_item in target_audio_items:
         item_id = target_item.get("id")
-
-        # Find the matching item from the source data.
-        if item_id and item_id in source_items_by_id:
-            source_item = source_items_by_id[item_id]
-
-            # This is the core logic: copy the edit_instructions if they exist.
-            if "edit_instructions" in source_item:
-                target_item["edit_instructions"] = source_item["edit_instructions"]
-                items_updated_count += 1
+        if item_id and item_id in edits_by_id:
+            target_item["edit_instructions"] = edits_by_id[item_id]
+            items_updated_count += 1
 
     print(f"Finished applying edits. Updated {items_updated_count} timeline items.")
     return target_project
@@ -1813,7 +2169,7 @@ def send_result_with_alert(
 
     send_message_to_go(
         "taskResult",
-        response_payload,
+        dump_json_bytes(response_payload),
         task_id=task_id,
     )
 
@@ -1827,7 +2183,7 @@ def send_progress_update(
 
     send_message_to_go(
         "taskUpdate",
-        response_payload,
+        dump_json_bytes(response_payload),
         task_id=task_id,
     )
 
@@ -1903,7 +2259,7 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
         }
         send_message_to_go(
             "taskResult",
-            response_payload,
+            dump_json_bytes(response_payload),
             task_id=task_id,
         )
         return False
@@ -1923,7 +2279,9 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
             "alertSeverity": "info",
         }
 
-        send_message_to_go("taskResult", response_payload, task_id=task_id)
+        send_message_to_go(
+            "taskResult", dump_json_bytes(response_payload), task_id=task_id
+        )
         return False
 
     # export state of current timeline to otio, EXPENSIVE
@@ -1943,7 +2301,9 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
                 "alertSeverity": "error",
             }
             print(response_payload)
-            send_message_to_go("taskResult", response_payload, task_id=task_id)
+            send_message_to_go(
+                "taskResult", dump_json_bytes(response_payload), task_id=task_id
+            )
             return
 
     if sync:
@@ -1954,16 +2314,23 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
         print("just syncing, exiting")
         print(f"it took {time() - script_start_time:.2f} seconds for script to finish")
 
+        # Strip the live Resolve handles up front so the serializer never
+        # has to fall back to inspecting BMD proxies. Go doesn't use them.
         response_payload = {
             "status": "success",
             "message": "Sync successful!",
-            "data": PROJECT_DATA,
+            "data": make_project_data_serializable(PROJECT_DATA),
         }
 
         send_message_to_go(
-            message_type="taskResult", payload=response_payload, task_id=task_id
+            message_type="taskResult",
+            payload=dump_json_bytes(response_payload),
+            task_id=task_id,
         )
-        export_timeline_to_otio(TIMELINE, file_path=input_otio_path)
+        # get_project_data above may already have exported the timeline;
+        # don't pay for a second identical export.
+        if not TIMELINE_OTIO_EXPORTED:
+            export_timeline_to_otio(TIMELINE, file_path=input_otio_path)
         print(f"Exported timeline to OTIO in {input_otio_path}")
         return
 
@@ -1992,7 +2359,11 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
 
     TRACKER.update_task_progress("prepare", 50.0, message="Preparing")
     unify_linked_items_in_project_data(input_otio_path)
-    print(f"project data after unify: {PROJECT_DATA}")
+    logging.debug(
+        "project data after unify: %d video / %d audio items",
+        len(PROJECT_DATA["timeline"]["video_track_items"]),
+        len(PROJECT_DATA["timeline"]["audio_track_items"]),
+    )
 
     TRACKER.complete_task("prepare")
     TRACKER.update_task_progress("append", 1.0, "Adding Clips to Timeline")
@@ -2011,7 +2382,9 @@ def main(sync: bool = False, task_id: str = "") -> Optional[bool]:
     }
 
     send_message_to_go(
-        message_type="taskResult", payload=response_payload, task_id=task_id
+        message_type="taskResult",
+        payload=dump_json_bytes(response_payload),
+        task_id=task_id,
     )
 
     # apply_edits()
@@ -2037,6 +2410,7 @@ class AppendedClipInfo(TypedDict):
     link_key: Tuple[int, int]
     enabled: bool
     auto_linked: bool  # Flag to track optimization
+    source_file_path: str
 
 
 def _append_clips_to_timeline(
@@ -2056,14 +2430,23 @@ def _append_clips_to_timeline(
     fps_ratio = project_fps / timeline_fps
     print(f"FPS RATIO IS {fps_ratio}")
 
-    grouped_clips: Dict[Tuple[int, int], List[AppendedClipInfo]] = {}
+    grouped_clips: Dict[Tuple[int, int], List[AppendedClipInfo]] = defaultdict(list)
 
     for item in timeline_items:
         link_id = item.get("link_group_id")
         if link_id is None:
             continue
-        media_type = 1 if item["track_type"] == "video" else 2
-        for i, edit in enumerate(item.get("edit_instructions", [])):
+        edit_instructions = item.get("edit_instructions")
+        if not edit_instructions:
+            continue
+        # Per-item values, looked up once rather than for every edit. All
+        # are filled in when the item is loaded by get_items_by_tracktype;
+        # asking Resolve for a missing media pool item again returns None.
+        media_type = item["media_type"]
+        track_index = item["track_index"]
+        bmd_mpi = item["bmd_mpi"]
+        source_file_path = item["source_file_path"]
+        for i, edit in enumerate(edit_instructions):
             record_frame = edit.get("start_frame", 0)
             end_frame = edit.get("end_frame", 0)
             duration_frames = end_frame - record_frame
@@ -2072,15 +2455,12 @@ def _append_clips_to_timeline(
             source_start = edit.get("source_start_frame", 0)
             source_end = source_start + (duration_frames * fps_ratio)
 
-            if not item.get("bmd_mpi"):
-                item["bmd_mpi"] = item["bmd_item"].GetMediaPoolItem()
-
             clip_info_for_api: Dict = {
-                "mediaPoolItem": item["bmd_mpi"],
+                "mediaPoolItem": bmd_mpi,
                 "startFrame": source_start,
                 "endFrame": edit["source_end_frame"],
                 "recordFrame": record_frame,
-                "trackIndex": item["track_index"],
+                "trackIndex": track_index,
                 "mediaType": media_type,
             }
             link_key = (link_id, i)
@@ -2089,8 +2469,9 @@ def _append_clips_to_timeline(
                 "link_key": link_key,
                 "enabled": edit.get("enabled", True),
                 "auto_linked": False,
+                "source_file_path": source_file_path,
             }
-            grouped_clips.setdefault(link_key, []).append(appended_clip)
+            grouped_clips[link_key].append(appended_clip)
 
     if not grouped_clips:
         return [], []
@@ -2103,16 +2484,14 @@ def _append_clips_to_timeline(
         is_optimizable = False
         if len(group) == 2:
             clip1, clip2 = group
-            mpi1 = clip1["clip_info"]["mediaPoolItem"]
-            mpi2 = clip2["clip_info"]["mediaPoolItem"]
-            path1 = mpi1.GetClipProperty("File Path") if mpi1 else None
-            path2 = mpi2.GetClipProperty("File Path") if mpi2 else None
+            path1 = clip1["source_file_path"]
+            path2 = clip2["source_file_path"]
 
             if (
                 {c["clip_info"]["mediaType"] for c in group} == {1, 2}
                 and clip1["clip_info"]["trackIndex"] == 1
                 and clip2["clip_info"]["trackIndex"] == 1
-                and (path1 is not None and path1 == path2)
+                and (path1 and path1 == path2)
             ):
                 is_optimizable = True
 
@@ -2123,31 +2502,42 @@ def _append_clips_to_timeline(
                 clip["auto_linked"] = True
 
             # Prepare a single, optimized instruction for the API call
-            optimized_clip_info = group[0]["clip_info"].copy()
-            del optimized_clip_info["mediaType"]
-            del optimized_clip_info["trackIndex"]
-            final_api_batch.append(optimized_clip_info)
+            final_api_batch.append(
+                {
+                    k: v
+                    for k, v in group[0]["clip_info"].items()
+                    if k != "mediaType" and k != "trackIndex"
+                }
+            )
         else:
             # If not optimizable, add the original clip_info for each clip
-            for clip in group:
-                final_api_batch.append(clip["clip_info"])
+            final_api_batch.extend(clip["clip_info"] for clip in group)
 
         # Always add the full, original clip info to our source-of-truth list
         all_processed_clips.extend(group)
 
-    all_processed_clips.sort(key=lambda item: item["clip_info"].get("recordFrame", 0))
+    # Groups are usually emitted in record-frame order already, so only sort
+    # when a single pass finds an out-of-order pair.
+    decorated = [
+        (clip["clip_info"]["recordFrame"], clip) for clip in all_processed_clips
+    ]
+    if any(a[0] > b[0] for a, b in zip(decorated, decorated[1:])):
+        decorated.sort(key=itemgetter(0))
+        all_processed_clips = [clip for _, clip in decorated]
 
     # --- Make unified API calls with a defined batch size ---
     print(f"Appending {len(final_api_batch)} total clip instructions to timeline...")
     BATCH_SIZE = 100
     appended_bmd_items: List[Any] = []
-    print(f"FINAL API BATCH: {final_api_batch}")
+    # Formatting the whole batch (including a repr of every media pool item)
+    # is costly, so only do it when debug logging is on.
+    logging.debug("FINAL API BATCH: %s", final_api_batch)
 
     for i in range(0, len(final_api_batch), BATCH_SIZE):
         chunk = final_api_batch[i : i + BATCH_SIZE]
-        appended = media_pool.AppendToTimeline(chunk) or []
-        appended_bmd_items.extend(appended)
+        appended = media_pool.AppendToTimeline(chunk)
         if appended:
+            appended_bmd_items.extend(appended)
             TRACKER.update_task_progress(
                 "append",
                 10.0 + (i / len(final_api_batch)) * 80.0,
@@ -2160,26 +2550,24 @@ def clip_is_uncut(item: TimelineItem) -> bool:
     """
     Checks if a clip is uncut, meaning it has no edit instructions.
     """
-    if not item.get("edit_instructions") or len(item["edit_instructions"]) == 0:
+    edit_instructions = item.get("edit_instructions")
+    if not edit_instructions:
         return True
 
-    if len(item["edit_instructions"]) > 1:
+    if len(edit_instructions) > 1:
         return False
 
     # check if the only edit instruction is a full clip
-    edit_instruction = item["edit_instructions"][0]
+    edit_instruction = edit_instructions[0]
     TOLERANCE = 0.01
-    if (
+    return (
         abs(edit_instruction["start_frame"] - item["start_frame"]) < TOLERANCE
         and abs(edit_instruction["end_frame"] - item["end_frame"]) < TOLERANCE
         and abs(edit_instruction["source_start_frame"] - item["source_start_frame"])
         < TOLERANCE
         and abs(edit_instruction["source_end_frame"] - item["source_end_frame"])
         < TOLERANCE
-    ):
-        return True
-
-    return False
+    )
 
 
 def append_and_link_timeline_items(
@@ -2315,14 +2703,15 @@ def append_and_link_timeline_items(
         print("Clearing all clips from existing timeline...")
         all_clips_to_delete = []
 
-        # Iterate through all video tracks that might have content
-        for item in PROJECT_DATA["timeline"]["video_track_items"]:
-            type = item["type"]
+        # Iterate through all video and audio tracks that might have content
+        for item in chain(
+            PROJECT_DATA["timeline"]["video_track_items"],
+            PROJECT_DATA["timeline"]["audio_track_items"],
+        ):
             if not item["bmd_item"]:
                 print(f"Warning, no bmd item set for '{item['name']}'")
                 continue
-            if not item["bmd_mpi"]:
-                item["bmd_mpi"] = item["bmd_item"].GetMediaPoolItem()
+            # bmd_mpi was fetched when the item was loaded; no need to ask again.
             if not item["bmd_mpi"]:
                 print(
                     f"Warning: No MediaPoolItem found for item '{item['name']}'. Skipping."
@@ -2332,33 +2721,11 @@ def append_and_link_timeline_items(
             if not item.get("edit_instructions"):
                 print(f"Skipping item '{item['name']}' with no edit instructions.")
                 continue
-            if clip_is_uncut(item):
-                print(f"Skipping uncut item '{item['name']}' with no edits.")
-                continue
-            if type:
-                all_clips_to_delete.append(item["bmd_item"])
-
-            print(f"marking {item} for deletion")
-
-            all_clips_to_delete.append(item["bmd_item"])
-
-        for item in PROJECT_DATA["timeline"]["audio_track_items"]:
-            type = item["type"]
-            if not item["bmd_mpi"]:
-                continue
-
-            if not item.get("edit_instructions"):
-                print(f"Skipping item '{item['name']}' with no edit instructions.")
-                continue
-
             if clip_is_uncut(item):
                 print(f"Skipping uncut item '{item['name']}' with no edits.")
                 continue
 
-            if type:
-                all_clips_to_delete.append(item["bmd_item"])
-
-            print(f"marking {item} for deletion")
+            print(f"marking '{item['name']}' for deletion")
 
             all_clips_to_delete.append(item["bmd_item"])
 
@@ -2394,7 +2761,6 @@ def append_and_link_timeline_items(
     # === STEP 4: APPEND, VERIFY, AND LINK CLIPS ===
     success = False
     num_retries = 4
-    sleep_time_between = 2.5
     for attempt in range(1, num_retries + 1):
         processed_clips, bmd_items_from_api = _append_clips_to_timeline(
             TIMELINE, media_pool, timeline_items
@@ -2418,83 +2784,77 @@ def append_and_link_timeline_items(
                     f"Identified {len(auto_linked_keys)} auto-linked groups to skip for manual linking."
                 )
 
-            link_key_lookup: Dict[Tuple[Optional[int], int, int], Tuple[int, int]] = {}
+            # One pass over the processed clips builds both the link lookup
+            # and the disabled set from the same key.
+            link_key_lookup: Dict[Tuple[int, int, int], Tuple[int, int]] = {}
+            disabled_keys: set[Tuple[int, int, int]] = set()
             for appended_clip in processed_clips:
-                clip_info, link_key = (
-                    appended_clip["clip_info"],
-                    appended_clip["link_key"],
-                )
+                clip_info = appended_clip["clip_info"]
                 lookup_key = (
-                    clip_info.get("mediaType"),
+                    clip_info["mediaType"],
                     clip_info["trackIndex"],
                     int(clip_info["recordFrame"]),  # Cast to int
                 )
-                link_key_lookup[lookup_key] = link_key
+                link_key_lookup[lookup_key] = appended_clip["link_key"]
+                if not appended_clip["enabled"]:
+                    disabled_keys.add(lookup_key)
+
+            # Single pass over the actual items: collect disabled clips and
+            # link groups from the same per-item key parts. Only the position
+            # and the item itself are needed, so skip get_items_by_tracktype
+            # and its per-item metadata calls.
+            disabled_bmd_items: List[Any] = []
+            link_groups: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+            for media_type, track_type in ((1, "video"), (2, "audio")):
+                for track_index in range(1, TIMELINE.GetTrackCount(track_type) + 1):
+                    track_items = (
+                        TIMELINE.GetItemListInTrack(track_type, track_index) or []
+                    )
+                    for bmd_item in track_items:
+                        # Note: For auto-linked clips, multiple actual items might
+                        # map back via different mediaTypes to the same original
+                        # recordFrame. The lookup key must be specific.
+                        actual_key = (
+                            media_type,
+                            track_index,
+                            int(bmd_item.GetStart(True)),
+                        )
 
-            actual_items: list[TimelineItem] = []
-            actual_items.extend(get_items_by_tracktype("video", TIMELINE))
-            actual_items.extend(get_items_by_tracktype("audio", TIMELINE))
+                        if disabled_keys and actual_key in disabled_keys:
+                            disabled_bmd_items.append(bmd_item)
 
-            disabled_keys = {
-                (
-                    p_clip["clip_info"]["mediaType"],
-                    p_clip["clip_info"]["trackIndex"],
-                    p_clip["clip_info"]["recordFrame"],
-                )
-                for p_clip in processed_clips
-                if not p_clip["enabled"]
-            }
+                        link_key = link_key_lookup.get(actual_key)
+                        if link_key is not None:
+                            link_groups[link_key].append(bmd_item)
+
+            # Resolve has no batch color API, so the writes are issued back to
+            # back once all reads are done instead of interleaving them.
             if disabled_keys:
-                disabled_count = 0
-                for item_dict in actual_items:
-                    media_type = 1 if item_dict["track_type"] == "video" else 2
-                    actual_key = (
-                        media_type,
-                        item_dict["track_index"],
-                        item_dict["start_frame"],
-                    )
-                    if actual_key in disabled_keys:
-                        bmd_item = item_dict["bmd_item"]
-                        bmd_item.SetClipColor("Violet")
-                        disabled_count += 1
-                print(f"Updated status for {disabled_count} clip(s).")
-
-            link_groups: Dict[Tuple[int, int], List[Any]] = {}
-            for item_dict in actual_items:
-                media_type = 1 if item_dict["track_type"] == "video" else 2
-                # Note: For auto-linked clips, multiple actual items might map back
-                # via different mediaTypes to the same original recordFrame.
-                # The lookup key must be specific.
-                lookup_key = (
-                    media_type,
-                    item_dict["track_index"],
-                    int(item_dict["start_frame"]),
-                )
-                link_key = link_key_lookup.get(lookup_key)
-                if link_key:
-                    link_groups.setdefault(link_key, []).append(item_dict["bmd_item"])
+                for bmd_item in disabled_bmd_items:
+                    bmd_item.SetClipColor("Violet")
+                print(f"Updated status for {len(disabled_bmd_items)} clip(s).")
 
             print("Performing manual linking for necessary clips...")
-            groups_to_link = {
-                k: v for k, v in link_groups.items() if k not in auto_linked_keys
-            }
+            # Set difference on the key views; clip lists are only looked up
+            # for the groups that survive.
+            keys_to_link = link_groups.keys() - auto_linked_keys
 
-            if not groups_to_link:
+            if not keys_to_link:
                 print("No clips required manual linking.")
             else:
-                length_link_groups = len(groups_to_link)
-                index = 1
-                for group_key, clips_to_link in groups_to_link.items():
+                # SetClipsLinked links every clip it is given into one group, so
+                # it has to be called once per group.
+                percent_per_group = 100.0 / len(keys_to_link)
+                for index, group_key in enumerate(keys_to_link, start=1):
+                    clips_to_link = link_groups[group_key]
                     if len(clips_to_link) >= 2:
                         print(f"  - Manually linking group: {group_key}")
                         TIMELINE.SetClipsLinked(clips_to_link, True)
 
                     if index % 10 == 1:
-                        percentage = (index / length_link_groups) * 100
                         TRACKER.update_task_progress(
-                            "link", percentage, "Linking clips..."
+                            "link", index * percent_per_group, "Linking clips..."
                         )
-                    index += 1
 
             TRACKER.complete_task("link")
             print("✅ Operation completed successfully.")
@@ -2505,8 +2865,7 @@ def append_and_link_timeline_items(
             # if bmd_items_from_api:
             #     TIMELINE.DeleteClips(bmd_items_from_api, delete_gaps=False)
             if attempt < num_retries:
-                sleep(sleep_time_between)
-                sleep_time_between += 1.5
+                sleep(backoff_delay(attempt - 1, base=2.5))
 
     if not success:
         print("❌ Operation failed after all retries. Please check the logs.")
@@ -2544,13 +2903,15 @@ def signal_go_ready(go_server_port: int):
     port = parsed_url.port or 80  # Default to port 80 if none
 
     max_retries = 5
-    retry_delay_seconds = 2
 
     print(f"Python Backend: Attempting to signal Go server at {ready_url}")
 
+    # One connection object is reused across attempts. After a failure it is
+    # closed and reconnects on the next request; it is closed once the signal
+    # succeeds.
+    conn = http.client.HTTPConnection(host, port, timeout=10)
     for attempt in range(max_retries):
         try:
-            conn = http.client.HTTPConnection(host, port, timeout=10)
             conn.request("GET", parsed_url.path)
             response = conn.getresponse()
             status = response.status
@@ -2567,12 +2928,19 @@ def signal_go_ready(go_server_port: int):
                 raise Exception(f"Unexpected status code: {status}")
 
         except Exception as e:
+            conn.close()
             print(
                 f"Python Backend: Error signaling Go (attempt {attempt + 1}/{max_retries}): {e}"
             )
             if attempt < max_retries - 1:
-                print(f"Python Backend: Retrying in {retry_delay_seconds} seconds...")
-                sleep(retry_delay_seconds)  # type: ignore
+                # Refused connections fail instantly, so the sleeps are the
+                # whole wait: with base 1.2 the 4 retries add up to 9-18 s,
+                # giving a slow-starting Go app at least the old fixed 8 s.
+                retry_delay_seconds = backoff_delay(attempt, base=1.2)
+                print(
+                    f"Python Backend: Retrying in {retry_delay_seconds:.2f} seconds..."
+                )
+                sleep(retry_delay_seconds)
             else:
                 print(
                     f"Python Backend: Failed to signal Go server after {max_retries} attempts."
@@ -2582,186 +2950,257 @@ def signal_go_ready(go_server_port: int):
     return False
 
 
+def run_final_timeline(
+    project_data_from_go_raw: Dict[str, Any], make_new_timeline: bool, task_id: str
+) -> None:
+    """Applies the edits received from Go and builds the final timeline."""
+    global PROJECT_DATA
+    global MAKE_NEW_TIMELINE
+
+    try:
+        project_data_from_go = ProjectData(**project_data_from_go_raw)
+        with COMMAND_LOCK:
+            # Requests are handled concurrently, so shared state is only
+            # touched while holding the lock.
+            MAKE_NEW_TIMELINE = make_new_timeline
+            if PROJECT_DATA:
+                PROJECT_DATA = apply_edits_from_go(PROJECT_DATA, project_data_from_go)
+            else:
+                PROJECT_DATA = project_data_from_go
+
+            main(sync=False, task_id=task_id)
+    except Exception as e:
+        print(f"Python Command Server: Error generating final timeline: {e}")
+        print(traceback.format_exc())
+        send_result_with_alert(
+            "Unexpected error",
+            f"Could not generate the final timeline: {e}",
+            task_id,
+        )
+
+
+# Constant response bodies, encoded once instead of on every request.
+_RESP_UNAUTHORIZED = dump_json_bytes({"status": "error", "message": "Unauthorized"})
+_RESP_NOT_FOUND = dump_json_bytes({"status": "error", "message": "Endpoint not found."})
+_RESP_REGISTERED = dump_json_bytes(
+    {"status": "success", "message": "Go server registered."}
+)
+_RESP_MISSING_PORT = dump_json_bytes(
+    {"status": "error", "message": "Missing 'go_server_port'."}
+)
+_RESP_INVALID_BODY = dump_json_bytes(
+    {"status": "error", "message": "Invalid or missing JSON body."}
+)
+_RESP_SHUTDOWN_ACK = dump_json_bytes(
+    {"status": "success", "message": "Shutdown acknowledged."}
+)
+_RESP_INVALID_JSON = dump_json_bytes(
+    {"status": "error", "message": "Invalid JSON format."}
+)
+_RESP_SYNC_RECEIVED = dump_json_bytes(
+    {"status": "success", "message": "Sync command received."}
+)
+_RESP_MISSING_PROJECT_DATA = dump_json_bytes(
+    {"status": "error", "message": "Missing projectData."}
+)
+_RESP_FINAL_TIMELINE_STARTED = dump_json_bytes(
+    {"status": "success", "message": "Final timeline generation started."}
+)
+_RESP_SAVE_RECEIVED = dump_json_bytes(
+    {"status": "success", "message": "Project save command received."}
+)
+_RESP_PLAYHEAD_FAILED = dump_json_bytes(
+    {"status": "error", "message": "Could not set playhead."}
+)
+_RESP_BUSY = dump_json_bytes(
+    {"status": "error", "message": "Another command is in progress."}
+)
+
+
 class PythonCommandHandler(BaseHTTPRequestHandler):
     """
     Handles HTTP POST requests for registration, shutdown, and commands from the Go frontend.
     """
 
+    # Keep-alive lets Go's pooled client reuse one connection (and one handler
+    # thread) across requests instead of a new TCP connection and thread each time.
+    protocol_version = "HTTP/1.1"
+
     def _send_json_response(self, status_code, data_dict):
         """Sends a JSON response with the given status code and data."""
+        self._send_raw_json(status_code, dump_json_bytes(data_dict))
+
+    def _send_raw_json(self, status_code, body: bytes, close: bool = False):
+        """
+        Sends an already encoded JSON body with the given status code. With
+        `close`, the connection is closed afterwards and the client is told so.
+        """
         self.send_response(status_code)
         self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
         self.send_header("Authorization", value=AUTH_TOKEN)
         self.end_headers()
-        self.wfile.write(json.dumps(data_dict).encode("utf-8"))
+        self.wfile.write(body)
 
     def do_POST(self):
         """Routes POST requests to the appropriate handler based on the URL path."""
-        global PROJECT_DATA
-        global AUTH_TOKEN
-        # --- Route 1: /register ---
-        # Handles the initial registration from the Go application.
-
         auth_header = self.headers.get("Authorization") or ""
-        req_token: str = ""
-        if "Bearer" in auth_header:
-            req_token = auth_header.split("Bearer")[1].strip()
-
-        auth_passed = req_token == AUTH_TOKEN
+        auth_passed = False
+        if AUTH_TOKEN and auth_header.startswith("Bearer "):
+            # Constant-time comparison so the token can't be probed via timing.
+            auth_passed = hmac.compare_digest(
+                auth_header[7:].strip().encode("utf-8"), AUTH_TOKEN.encode("utf-8")
+            )
         if not auth_passed:
             print("unauthorized request received.")
-            self._send_json_response(
-                401, {"status": "error", "message": "Unauthorized"}
-            )
-            return
-
-        if self.path == "/register":
-            try:
-                content_length = int(self.headers["Content-Length"])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode("utf-8"))
-                port = data.get("go_server_port")
-                if port:
-                    global GO_SERVER_PORT
-                    GO_SERVER_PORT = port
-                    print(f"Python Command Server: Registered Go server on port {port}")
-                    self._send_json_response(
-                        200, {"status": "success", "message": "Go server registered."}
-                    )
-                else:
-                    self._send_json_response(
-                        400, {"status": "error", "message": "Missing 'go_server_port'."}
-                    )
-            except (json.JSONDecodeError, ValueError):
-                self._send_json_response(
-                    400, {"status": "error", "message": "Invalid or missing JSON body."}
-                )
+            # The body is left unread, so the connection can't be reused.
+            self._send_raw_json(401, _RESP_UNAUTHORIZED, close=True)
             return
 
-        # --- Route 2: /shutdown ---
-        # Handles the shutdown signal from the Go application. No request body is expected.
-        elif self.path == "/shutdown":
-            print("Python Command Server: Received shutdown signal from Go. Exiting.")
-            self._send_json_response(
-                200, {"status": "success", "message": "Shutdown acknowledged."}
-            )
-
-            # Use os.kill to send a SIGINT (Ctrl+C) signal to the current process.
-            # This is the most reliable way to interrupt the httpd.serve_forever() loop.
-            # It's done in a thread to allow the HTTP response to be sent first.
-            threading.Thread(target=lambda: os.kill(os.getpid(), signal.SIGINT)).start()
+        handler = self._ROUTES.get(self.path)
+        if handler is None:
+            self._send_raw_json(404, _RESP_NOT_FOUND, close=True)
             return
+        handler(self)
 
-        # --- Route 3: /command ---
-        elif self.path == "/command":
-            command = None  # Initialize command here
-            # --- Command Processing ---
-            try:
-                content_length = int(self.headers["Content-Length"])
-                post_data_bytes = self.rfile.read(content_length)
-                data = json.loads(post_data_bytes.decode("utf-8"))
-                command = data.get("command")
-                params = data.get("params", {})
-                task_id = params.get("taskId")
-
-                # Your existing command handling logic
-                if command == "sync":
-                    self._send_json_response(
-                        200, {"status": "success", "message": "Sync command received."}
-                    )
-                    main(sync=True, task_id=task_id)
-                    return  # Important: return after handling a command
-
-                elif command == "makeFinalTimeline":
-                    project_data_from_go_raw = params.get("projectData")
-                    global MAKE_NEW_TIMELINE
-                    MAKE_NEW_TIMELINE = params.get("makeNewTimeline", False)
-
-                    if not project_data_from_go_raw:
-                        self._send_json_response(
-                            400, {"status": "error", "message": "Missing projectData."}
-                        )
-                        return
+    def _handle_register(self):
+        """Handles the initial registration from the Go application."""
+        global GO_SERVER_PORT
+        try:
+            content_length = int(self.headers["Content-Length"])
+            post_data = self.rfile.read(content_length)
+            data = load_json_bytes(post_data)
+            port = data.get("go_server_port")
+            if port:
+                GO_SERVER_PORT = port
+                print(f"Python Command Server: Registered Go server on port {port}")
+                self._send_raw_json(200, _RESP_REGISTERED)
+            else:
+                self._send_raw_json(400, _RESP_MISSING_PORT)
+        except (json.JSONDecodeError, ValueError):
+            self._send_raw_json(400, _RESP_INVALID_BODY)
 
-                    project_data_from_go = ProjectData(**project_data_from_go_raw)
-                    self._send_json_response(
-                        200,
-                        {
-                            "status": "success",
-                            "message": "Final timeline generation started.",
-                        },
-                    )
+    def _handle_shutdown(self):
+        """Handles the shutdown signal from Go. No request body is expected."""
+        print("Python Command Server: Received shutdown signal from Go. Exiting.")
+        self._send_raw_json(200, _RESP_SHUTDOWN_ACK)
 
-                    if PROJECT_DATA:
-                        PROJECT_DATA = apply_edits_from_go(
-                            PROJECT_DATA, project_data_from_go
-                        )
-                    else:
-                        PROJECT_DATA = project_data_from_go
+        # Wake the main thread, which stops the server and exits. The
+        # response above has already been written at this point.
+        SHUTDOWN_EVENT.set()
 
-                    main(sync=False, task_id=task_id)
-                    return
+    def _handle_command(self):
+        """Parses a command request from Go and dispatches it by name."""
+        command = None  # Initialize command here
+        # --- Command Processing ---
+        try:
+            content_length = int(self.headers["Content-Length"])
+            post_data_bytes = self.rfile.read(content_length)
+            data = load_json_bytes(post_data_bytes)
+            command = data.get("command")
+            params = data.get("params", {})
+            task_id = params.get("taskId")
+
+            # The shutdown command is handled by the /shutdown endpoint, not here.
+            command_handler = (
+                self._COMMANDS.get(command) if isinstance(command, str) else None
+            )
+            if command_handler is None:
+                self._send_json_response(
+                    400,
+                    {"status": "error", "message": f"Unknown command: {command}"},
+                )
+                return
+            command_handler(self, params, task_id)
 
-                elif command == "saveProject":
-                    self._send_json_response(
-                        200,
-                        {
-                            "status": "success",
-                            "message": "Project save command received.",
-                        },
-                    )
-                    return
+        except (json.JSONDecodeError, ValueError):
+            print(
+                f"Python Command Server: Invalid JSON received from Go for /command. for command {command}"
+            )
+            self._send_raw_json(400, _RESP_INVALID_JSON)
+        except Exception as e:
+            print(f"Python Command Server: Error processing command: {e}")
+            print(traceback.format_exc())
+            self._send_json_response(
+                500,
+                {"status": "error", "message": f"Internal server error: {str(e)}"},
+            )
 
-                elif command == "setPlayhead":
-                    time_value = params.get("time")
-                    if time_value is not None and set_timecode(time_value, task_id):
-                        self._send_json_response(
-                            200,
-                            {
-                                "status": "success",
-                                "message": f"Playhead set to {time_value}.",
-                            },
-                        )
-                    else:
-                        self._send_json_response(
-                            400,
-                            {"status": "error", "message": "Could not set playhead."},
-                        )
-                    return
+    def _cmd_sync(self, params: Dict[str, Any], task_id: str):
+        self._send_raw_json(200, _RESP_SYNC_RECEIVED)
+        # The response has already been sent, so a failure can't become an
+        # HTTP error here; it would be an unrequested second response on a
+        # keep-alive connection. Report it to Go as a task result instead.
+        try:
+            with COMMAND_LOCK:
+                main(sync=True, task_id=task_id)
+        except Exception as e:
+            print(f"Python Command Server: Error during sync: {e}")
+            print(traceback.format_exc())
+            send_result_with_alert("Sync error", f"Sync failed: {e}", task_id)
 
-                # IMPORTANT: The shutdown command is now handled by the /shutdown endpoint, not here.
-                # It has been removed from this section.
+    def _cmd_make_final_timeline(self, params: Dict[str, Any], task_id: str):
+        project_data_from_go_raw = params.get("projectData")
+        make_new_timeline = params.get("makeNewTimeline", False)
 
-                else:
-                    self._send_json_response(
-                        400,
-                        {"status": "error", "message": f"Unknown command: {command}"},
-                    )
-                    return
+        if not project_data_from_go_raw:
+            self._send_raw_json(400, _RESP_MISSING_PROJECT_DATA)
+            return
 
-            except (json.JSONDecodeError, ValueError):
-                print(
-                    f"Python Command Server: Invalid JSON received from Go for /command. for command {command}"
-                )
-                self._send_json_response(
-                    400, {"status": "error", "message": "Invalid JSON format."}
-                )
-            except Exception as e:
-                print(f"Python Command Server: Error processing command: {e}")
-                print(traceback.format_exc())
-                self._send_json_response(
-                    500,
-                    {"status": "error", "message": f"Internal server error: {str(e)}"},
-                )
+        self._send_raw_json(200, _RESP_FINAL_TIMELINE_STARTED)
+
+        # The work runs on its own thread so this request completes
+        # (and Go gets the response) right away.
+        threading.Thread(
+            target=run_final_timeline,
+            args=(project_data_from_go_raw, make_new_timeline, task_id),
+            daemon=True,
+        ).start()
+
+    def _cmd_save_project(self, params: Dict[str, Any], task_id: str):
+        self._send_raw_json(200, _RESP_SAVE_RECEIVED)
+
+    def _cmd_set_playhead(self, params: Dict[str, Any], task_id: str):
+        # The Resolve API isn't thread-safe and main() may be replacing
+        # TIMELINE right now. Moving the playhead isn't worth waiting for a
+        # whole edit, so report busy instead of blocking.
+        if not COMMAND_LOCK.acquire(blocking=False):
+            self._send_raw_json(409, _RESP_BUSY)
             return
+        try:
+            time_value = params.get("time")
+            success = time_value is not None and set_timecode(time_value, task_id)
+        finally:
+            COMMAND_LOCK.release()
 
-        # --- Fallback: Not Found ---
-        # If the path is not /register, /shutdown, or /command
-        else:
+        if success:
             self._send_json_response(
-                404, {"status": "error", "message": "Endpoint not found."}
+                200,
+                {
+                    "status": "success",
+                    "message": f"Playhead set to {time_value}.",
+                },
             )
-            return
+        else:
+            self._send_raw_json(400, _RESP_PLAYHEAD_FAILED)
+
+    # Maps command names from Go to their handlers.
+    _COMMANDS = {
+        "sync": _cmd_sync,
+        "makeFinalTimeline": _cmd_make_final_timeline,
+        "saveProject": _cmd_save_project,
+        "setPlayhead": _cmd_set_playhead,
+    }
+
+    # Maps request paths to their handlers; looked up once per request.
+    _ROUTES = {
+        "/register": _handle_register,
+        "/shutdown": _handle_shutdown,
+        "/command": _handle_command,
+    }
 
 
 def find_free_port():
@@ -2786,6 +3225,74 @@ def read_stdin_nonblocking(timeout=0.1):
     return str(result[0].strip()) if result else ""
 
 
+# Potential paths for the HushCut binary per platform, computed once at import.
+# The first existing path found will be used.
+_BIN_NAME = "HushCut.exe" if IS_WIN else "HushCut"
+_BUILD_BIN_DIR = os.path.join(SCRIPT_DIR, "..", "..", "build", "bin")
+_MAC_BUNDLE_BIN = os.path.join("HushCut.app", "Contents", "MacOS", _BIN_NAME)
+_BINARY_LOOKUPS: Dict[str, Tuple[str, ...]] = {
+    "darwin": (
+        # 1. Check current directory (same level as the script)
+        os.path.join(SCRIPT_DIR, _MAC_BUNDLE_BIN),
+        # 2. Check the .app bundle path (production)
+        os.path.join(_BUILD_BIN_DIR, _MAC_BUNDLE_BIN),
+        # 3. Check direct executable path (development build)
+        os.path.join(_BUILD_BIN_DIR, _BIN_NAME),
+    ),
+    "win32": (
+        os.path.join(SCRIPT_DIR, _BIN_NAME),
+        os.path.join(_BUILD_BIN_DIR, _BIN_NAME),
+    ),
+    "linux": (
+        os.path.join(SCRIPT_DIR, _BIN_NAME),
+        os.path.join(_BUILD_BIN_DIR, _BIN_NAME),
+    ),
+}
+_BINARY_CANDIDATES: Tuple[str, ...] = tuple(
+    os.path.abspath(p) for p in _BINARY_LOOKUPS.get(sys.platform, ())
+)
+
+
+def _is_executable_file(path: str) -> bool:
+    """Checks with a single stat() that path is a regular, executable file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+def find_go_app_path() -> str:
+    """
+    Returns the path of the HushCut Go binary, or an empty string if it can't be
+    found. Candidates are checked in priority order and the first existing one
+    wins.
+    """
+    # Find the first valid path
+    go_app_path = next((p for p in _BINARY_CANDIDATES if _is_executable_file(p)), "")
+    if not go_app_path:
+        print(f"Python Backend: Binary not found at: {', '.join(_BINARY_CANDIDATES)}")
+    else:
+        print(f"Python Backend: Found binary at: {go_app_path}")
+
+    return go_app_path
+
+
+def setup_logging() -> None:
+    """
+    Routes log records through a queue so the threads that log (request
+    handlers, progress updates) never block on writing to stderr; a single
+    listener thread does the actual output.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)  # flushes anything still queued
+
+
 def init():
     global GO_SERVER_PORT
     global RESOLVE
@@ -2794,6 +3301,8 @@ def init():
     global SERVER_INSTANCE_HOLDER
     global AUTH_TOKEN
 
+    setup_logging()
+
     AUTH_TOKEN = read_stdin_nonblocking()
     if AUTH_TOKEN == "":
         print("No token specified, exiting.")
@@ -2846,8 +3355,11 @@ def init():
 
     # Initialize the HTTP server for Go commands
     server_address = ("127.0.0.1", PYTHON_LISTEN_PORT)
-    httpd = HTTPServer(server_address, PythonCommandHandler)
+    httpd = ThreadingHTTPServer(server_address, PythonCommandHandler)
     SERVER_INSTANCE_HOLDER.append(httpd)
+    # Serve from a background thread (one thread per request) so commands are
+    # handled as soon as they arrive, including while Go is being launched.
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
     print(
         f"Python Command Server: Listening for Go commands on http://127.0.0.1:{PYTHON_LISTEN_PORT}"
     )
@@ -2864,56 +3376,30 @@ def init():
             )
 
             # Check if 'wails' command is available
-            try:
-                subprocess.run(["wails", "version"], check=True, capture_output=True)
-            except FileNotFoundError:
+            if shutil.which("wails") is None:
                 print(
                     "Python Backend: Error: 'wails' command not found. Please ensure Wails CLI is installed and in your system's PATH."
                 )
                 sys.exit(1)
-            except subprocess.CalledProcessError as e:
-                print(
-                    f"Python Backend: Error running 'wails version': {e.stdout.decode()}{e.stderr.decode()}"
-                )
-                sys.exit(1)
 
             # Pass the Python command port via an environment variable for wails dev
-            env = os.environ.copy()
-            env["WAILS_PYTHON_PORT"] = str(PYTHON_LISTEN_PORT)
-            if sys.platform.startswith("linux"):
-                env["GDK_BACKEND"] = "x11"
+            env = {**CHILD_ENV, "WAILS_PYTHON_PORT": str(PYTHON_LISTEN_PORT)}
             wails_dev_command = ["wails", "dev"]
             try:
-                # Use Popen to run in the background and not block the Python script
-                # Capture stdout/stderr to help diagnose issues
-                process = subprocess.Popen(
+                # Use Popen to run in the background and not block the Python script.
+                # The child inherits our stdout/stderr so its output goes straight to
+                # the console without a Python thread pumping every line.
+                subprocess.Popen(
                     wails_dev_command,
                     cwd=project_root,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
                     env=env,
+                    stdout=CHILD_OUTPUT,
+                    stderr=CHILD_OUTPUT,
                 )
                 print(
                     f"Python Backend: 'wails dev' launched with command: {wails_dev_command} in {project_root}"
                 )
 
-                # Read and print output in a non-blocking way (for debugging)
-                def read_output(pipe, prefix):
-                    for line in pipe:
-                        print(f"[{prefix}] {line.strip()}")
-
-                threading.Thread(
-                    target=read_output,
-                    args=(process.stdout, "WAILS_STDOUT"),
-                    daemon=True,
-                ).start()
-                threading.Thread(
-                    target=read_output,
-                    args=(process.stderr, "WAILS_STDERR"),
-                    daemon=True,
-                ).start()
-
                 print(
                     "Python Backend: Go application launch initiated. Waiting for Go to register."
                 )
@@ -2922,69 +3408,7 @@ def init():
                 print(f"Python Backend: Error launching 'wails dev': {e}")
         else:
             print("Python Backend: Launching Go Wails application...")
-            go_app_path = ""
-
-            # Define potential paths for the HushCut binary
-            # The first existing path found will be used
-            potential_paths = []
-
-            if sys.platform.startswith("darwin"):  # macOS
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(
-                        os.path.join(
-                            SCRIPT_DIR, "HushCut.app", "Contents", "MacOS", "HushCut"
-                        )
-                    ),
-                    # 2. Check the .app bundle path (production)
-                    os.path.abspath(
-                        os.path.join(
-                            SCRIPT_DIR,
-                            "..",
-                            "..",
-                            "build",
-                            "bin",
-                            "HushCut.app",
-                            "Contents",
-                            "MacOS",
-                            "HushCut",
-                        )
-                    ),
-                    # 3. Check direct executable path (development build)
-                    os.path.abspath(
-                        os.path.join(SCRIPT_DIR, "..", "..", "build", "bin", "HushCut")
-                    ),
-                ]
-            elif sys.platform.startswith("win"):  # Windows
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(os.path.join(SCRIPT_DIR, "HushCut.exe")),
-                    # 2. Check build path
-                    os.path.abspath(
-                        os.path.join(
-                            SCRIPT_DIR, "..", "..", "build", "bin", "HushCut.exe"
-                        )
-                    ),
-                ]
-            elif sys.platform.startswith("linux"):  # Linux
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(os.path.join(SCRIPT_DIR, "HushCut")),
-                    # 2. Check build path
-                    os.path.abspath(
-                        os.path.join(SCRIPT_DIR, "..", "..", "build", "bin", "HushCut")
-                    ),
-                ]
-
-            # Find the first valid path
-            for path in potential_paths:
-                print(f"Python Backend: Checking for binary at: {path}")
-                if os.path.exists(path):
-                    go_app_path = path
-                    print(f"Python Backend: Found binary at: {go_app_path}")
-                    break
-                else:
-                    print(f"Python Backend: Binary not found at: {path}")
+            go_app_path = find_go_app_path()
 
             if not go_app_path:
                 print(
@@ -2992,11 +3416,11 @@ def init():
                 )
             else:
                 go_command = [go_app_path, "--python-port", str(PYTHON_LISTEN_PORT)]
-                env = os.environ.copy()
-                if sys.platform.startswith("linux"):
-                    env["GDK_BACKEND"] = "x11"
+                env = CHILD_ENV
                 try:
-                    subprocess.Popen(go_command, env=env)
+                    subprocess.Popen(
+                        go_command, env=env, stdout=CHILD_OUTPUT, stderr=CHILD_OUTPUT
+                    )
                     print(
                         f"Python Backend: Go Wails application launched with command: {go_command} and env GDK_BACKEND={env.get('GDK_BACKEND')}"
                     )
@@ -3014,206 +3438,13 @@ def init():
                 "Python Backend: Successfully signaled main readiness to Go application."
             )
 
-    # The main loop for the Python script to keep running and handling Resolve API calls.
-    # This loop will also allow the background HTTP server thread to process requests.
-    print("Python Backend: Running. Command server is active in a background thread.")
-    try:
-        while not SHUTDOWN_EVENT.is_set():
-            # Handle any incoming requests. This will block until a request comes in.
-            # If no request comes in, it will block indefinitely. This is desired
-            # as the script should only process commands when they arrive.
-            httpd.handle_request()
-            # Small sleep to prevent busy-waiting if no requests are coming in
-            # and to allow Resolve's main loop to process other events.
-            sleep(0.01)  # type: ignore  # type: ignore
-    except KeyboardInterrupt:
-        print("Python Backend: Keyboard interrupt detected. Shutting down.")
-        SHUTDOWN_EVENT.set()
-    except Exception as e:
-        print(f"FATAL ERROR in command server loop: {e}", file=sys.stderr)
-        traceback.print_exc()
-    finally:
-        print("Python Backend: Exiting main loop.")
-        # Graceful Shutdown
-        if SERVER_INSTANCE_HOLDER:
-            httpd = SERVER_INSTANCE_HOLDER[0]
-            print("Python Backend: Shutting down HTTP server...")
-            httpd.server_close()  # Close the server socket
-
-    print("Python Backend: Exiting.")
-
-    # Wait for Go to register, or launch Go if it doesn't register within a timeout.
-    go_registered = False
-    start_time = time()
-    while time() - start_time < 10:  # 10-second timeout for Go registration
-        # Handle any incoming requests during the wait period
-        httpd.handle_request()
-        if GO_SERVER_PORT != 0:  # GO_SERVER_PORT is set by the /register endpoint
-            print("Python Backend: Go application registered successfully.")
-            go_registered = True
-            break
-        sleep(0.1)  # Check more frequently during the initial handshake
-
-    if not go_registered:
-        print(
-            "Python Backend: Go application did not register within timeout. Launching Go Wails application..."
-        )
-        if args.wails_dev:
-            print(
-                "Python Backend: Launching Go Wails application in development mode..."
-            )
-            project_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..")
-            )
-
-            # Check if 'wails' command is available
-            try:
-                subprocess.run(["wails", "version"], check=True, capture_output=True)
-            except FileNotFoundError:
-                print(
-                    "Python Backend: Error: 'wails' command not found. Please ensure Wails CLI is installed and in your system's PATH."
-                )
-                sys.exit(1)
-            except subprocess.CalledProcessError as e:
-                print(
-                    f"Python Backend: Error running 'wails version': {e.stdout.decode()}{e.stderr.decode()}"
-                )
-                sys.exit(1)
-
-            # Pass the Python command port via an environment variable for wails dev
-            env = os.environ.copy()
-            env["WAILS_PYTHON_PORT"] = str(PYTHON_LISTEN_PORT)
-            if sys.platform.startswith("linux"):
-                env["GDK_BACKEND"] = "x11"
-            wails_dev_command = ["wails", "dev"]
-            try:
-                # Use Popen to run in the background and not block the Python script
-                # Capture stdout/stderr to help diagnose issues
-                process = subprocess.Popen(
-                    wails_dev_command,
-                    cwd=project_root,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    env=env,
-                )
-                print(
-                    f"Python Backend: 'wails dev' launched with command: {wails_dev_command} in {project_root}"
-                )
-
-                # Read and print output in a non-blocking way (for debugging)
-                def read_output(pipe, prefix):
-                    for line in pipe:
-                        print(f"[{prefix}] {line.strip()}")
-
-                threading.Thread(
-                    target=read_output,
-                    args=(process.stdout, "WAILS_STDOUT"),
-                    daemon=True,
-                ).start()
-                threading.Thread(
-                    target=read_output,
-                    args=(process.stderr, "WAILS_STDERR"),
-                    daemon=True,
-                ).start()
-
-                print(
-                    "Python Backend: Go application launch initiated. Waiting for Go to register."
-                )
-
-            except Exception as e:
-                print(f"Python Backend: Error launching 'wails dev': {e}")
-        else:
-            print("Python Backend: Launching Go Wails application...")
-            go_app_path = ""
-
-            # Define potential paths for the HushCut binary
-            # The first existing path found will be used
-            potential_paths = []
-
-            if sys.platform.startswith("darwin"):  # macOS
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(os.path.join(SCRIPT_DIR, "HushCut")),
-                    # 2. Check the .app bundle path (production)
-                    os.path.abspath(
-                        os.path.join(
-                            SCRIPT_DIR,
-                            "..",
-                            "..",
-                            "build",
-                            "bin",
-                            "HushCut.app",
-                            "Contents",
-                            "MacOS",
-                            "HushCut",
-                        )
-                    ),
-                    # 3. Check direct executable path (development build)
-                    os.path.abspath(
-                        os.path.join(SCRIPT_DIR, "..", "..", "build", "bin", "HushCut")
-                    ),
-                ]
-            elif sys.platform.startswith("win"):  # Windows
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(os.path.join(SCRIPT_DIR, "HushCut.exe")),
-                    # 2. Check build path
-                    os.path.abspath(
-                        os.path.join(
-                            SCRIPT_DIR, "..", "..", "build", "bin", "HushCut.exe"
-                        )
-                    ),
-                ]
-            elif sys.platform.startswith("linux"):  # Linux
-                potential_paths = [
-                    # 1. Check current directory (same level as the script)
-                    os.path.abspath(os.path.join(SCRIPT_DIR, "HushCut")),
-                    # 2. Check build path
-                    os.path.abspath(
-                        os.path.join(SCRIPT_DIR, "..", "..", "build", "bin", "HushCut")
-                    ),
-                ]
-
-            # Find the first valid path
-            for path in potential_paths:
-                print(f"Python Backend: Checking for binary at: {path}")
-                if os.path.exists(path):
-                    go_app_path = path
-                    print(f"Python Backend: Found binary at: {go_app_path}")
-                    break
-                else:
-                    print(f"Python Backend: Binary not found at: {path}")
-
-            if not go_app_path:
-                print(
-                    "Python Backend: Error: Go Wails application 'HushCut' not found in any of the checked paths."
-                )
-            else:
-                go_command = [go_app_path, "--python-port", str(PYTHON_LISTEN_PORT)]
-                env = os.environ.copy()
-                if sys.platform.startswith("linux"):
-                    env["GDK_BACKEND"] = "x11"
-                try:
-                    subprocess.Popen(go_command, env=env)
-                    print(
-                        f"Python Backend: Go Wails application launched with command: {go_command} and env GDK_BACKEND={env.get('GDK_BACKEND')}"
-                    )
-                except Exception as e:
-                    print(f"Python Backend: Error launching Go Wails application: {e}")
-
-    # The main loop for the Python script to keep running and handling Resolve API calls.
-    # This loop will also allow the background HTTP server thread to process requests.
+    # The command server runs in its own thread; the main thread just blocks
+    # until a shutdown is requested. SIGTERM wakes it the same way, so the
+    # server socket is closed cleanly instead of the process being killed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: SHUTDOWN_EVENT.set())
     print("Python Backend: Running. Command server is active in a background thread.")
     try:
-        while not SHUTDOWN_EVENT.is_set():
-            # Handle any incoming requests. This will block until a request comes in.
-            # If no request comes in, it will block indefinitely. This is desired
-            # as the script should only process commands when they arrive.
-            httpd.handle_request()
-            # Small sleep to prevent busy-waiting if no requests are coming in
-            # and to allow Resolve's main loop to process other events.
-            sleep(0.01)  # type: ignore  # type: ignore
+        SHUTDOWN_EVENT.wait()
     except KeyboardInterrupt:
         print("Python Backend: Keyboard interrupt detected. Shutting down.")
         SHUTDOWN_EVENT.set()
@@ -3226,6 +3457,7 @@ def init():
         if SERVER_INSTANCE_HOLDER:
             httpd = SERVER_INSTANCE_HOLDER[0]
             print("Python Backend: Shutting down HTTP server...")
+            httpd.shutdown()  # Stop the serve_forever loop
             httpd.server_close()  # Close the server socket
 
     print("Python Backend: Exiting.")